@@ -10,6 +10,7 @@ import logging
 from typing import Any, Dict, Tuple
 
 from agents.base_agent import BaseAgent
+from agents.schemas import ActionOutput
 
 logger = logging.getLogger(__name__)
 
@@ -106,8 +107,9 @@ class ActionAgent(BaseAgent):
             structured=True,
         )
 
-        data = self._parse_json_response(response)
-        if not data:
+        parsed = self._parse_model_response(response, ActionOutput)
+        # An empty object is as unusable as invalid JSON
+        if parsed is None or not parsed.model_fields_set:
             logger.warning("Could not parse action JSON — defaulting to enrich_data")
             return (
                 "enrich_data",
@@ -115,12 +117,12 @@ class ActionAgent(BaseAgent):
                 "low",
             )
 
-        action = str(data.get("next_action", "enrich_data")).lower()
+        action = (parsed.next_action or "enrich_data").lower()
         if action not in _VALID_ACTIONS:
             action = "enrich_data"
 
-        reasoning = str(data.get("action_reasoning", "Determine next step from available lead context."))
-        confidence = str(data.get("action_confidence", "medium")).lower()
+        reasoning = parsed.action_reasoning or "Determine next step from available lead context."
+        confidence = (parsed.action_confidence or "medium").lower()
         if confidence not in _VALID_CONFIDENCE:
             confidence = "medium"
 
@@ -5,12 +5,21 @@ Base agent with shared utilities: prompt loading, JSON parsing, LLM calling.
 import json
 import logging
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Type, TypeVar
+
+from pydantic import BaseModel, ValidationError
 
 from services.claude_service import ClaudeService
 
+try:  # optional: faster decoding for the fallback path when installed
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
 
 class BaseAgent:
     """Shared base for all CRM agents."""
@@ -73,8 +82,8 @@ class BaseAgent:
 
         # Try direct parse
         try:
-            return json.loads(text)
-        except json.JSONDecodeError:
+            return _json_loads(text)
+        except ValueError:
             pass
 
         # Try to find JSON object in text
@@ -82,12 +91,35 @@ class BaseAgent:
         brace_end = text.rfind("}")
         if brace_start != -1 and brace_end > brace_start:
             try:
-                return json.loads(text[brace_start : brace_end + 1])
-            except json.JSONDecodeError:
+                return _json_loads(text[brace_start : brace_end + 1])
+            except ValueError:
                 pass
 
         return None
 
+    @classmethod
+    def _parse_model_response(cls, response: str, model: Type[ModelT]) -> Optional[ModelT]:
+        """
+        Parse an LLM response into a pydantic output model.
+
+        Structured calls usually return bare JSON, which is parsed and validated
+        in one pass. Fenced or wrapped JSON falls back to _parse_json_response.
+        Returns None if no valid object can be recovered.
+        """
+        try:
+            return model.model_validate_json(response)
+        except ValidationError:
+            pass
+
+        data = cls._parse_json_response(response)
+        if not isinstance(data, dict):
+            return None
+        try:
+            return model.model_validate(data)
+        except ValidationError as e:
+            logger.warning("LLM response did not match %s: %s", model.__name__, e)
+            return None
+
     @staticmethod
     def _clamp(value: float, min_val: float = 0, max_val: float = 100) -> float:
         """Clamp a value to [min_val, max_val]."""
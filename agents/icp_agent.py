@@ -11,6 +11,7 @@ from typing import Any, Dict
 
 from config import Config
 from agents.base_agent import BaseAgent
+from agents.schemas import ICPOutput
 
 logger = logging.getLogger(__name__)
 
@@ -63,9 +64,9 @@ class ICPAgent(BaseAgent):
 
     def _parse(self, response: str) -> Dict[str, Any]:
         """Parse the JSON response; return failure result if parsing fails."""
-        data = self._parse_json_response(response)
+        parsed = self._parse_model_response(response, ICPOutput)
 
-        if data is None:
+        if parsed is None:
             logger.warning("Failed to parse ICP response as JSON")
             return {
                 "icp_score": -1,
@@ -78,15 +79,20 @@ class ICPAgent(BaseAgent):
         dim_scores = {}
         total = 0
         for dim in DIMENSIONS:
-            score = data.get("dimension_scores", {}).get(dim, 0)
+            score = parsed.dimension_scores.get(dim, 0)
             score = int(self._clamp(score, 0, 20))
             dim_scores[dim] = score
             total += score
 
-        icp_score = int(self._clamp(data.get("icp_score", total), 0, 100))
-        confidence = int(self._clamp(data.get("confidence_score", 0), 0, 100))
-        reasoning = data.get("icp_reasoning", "")
-        data_gaps = data.get("data_gaps", "")
+        raw_score = parsed.icp_score if parsed.icp_score is not None else total
+        icp_score = int(self._clamp(raw_score, 0, 100))
+        confidence = int(self._clamp(parsed.confidence_score, 0, 100))
+        reasoning = parsed.icp_reasoning or ""
+        if isinstance(reasoning, list):
+            reasoning = " ".join(reasoning)
+        data_gaps = parsed.data_gaps or ""
+        if isinstance(data_gaps, list):
+            data_gaps = "; ".join(data_gaps)
 
         return {
             "icp_score": icp_score,
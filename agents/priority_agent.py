@@ -12,6 +12,7 @@ from typing import Any, Dict
 
 from config import Config
 from agents.base_agent import BaseAgent
+from agents.schemas import PriorityOutput
 
 logger = logging.getLogger(__name__)
 
@@ -117,15 +118,15 @@ class PriorityAgent(BaseAgent):
             structured=True,
         )
 
-        data = self._parse_json_response(response)
-        if data:
-            tier = str(data.get("priority_tier", "medium")).lower()
+        parsed = self._parse_model_response(response, PriorityOutput)
+        if parsed is not None and parsed.model_fields_set:
+            tier = (parsed.priority_tier or "medium").lower()
             if tier not in ("high", "medium", "low"):
                 tier = "medium"
-            reasoning = data.get("priority_reasoning", "Determined by AI analysis.")
-            return tier, str(reasoning)
+            reasoning = parsed.priority_reasoning or "Determined by AI analysis."
+            return tier, reasoning
 
-        # Fallback if JSON parse fails
+        # Fallback if JSON parse fails or carries none of the expected fields
         logger.warning("Could not parse priority JSON — defaulting to medium")
         return "medium", "Could not parse LLM response; defaulting to medium."
 
@@ -80,14 +80,14 @@ class ResearchAgent(BaseAgent):
             len(citations),
         )
 
-        brief = response
-        if citations:
-            brief = f"{response}\n\n## SOURCES\n" + "\n".join(f"- {c}" for c in citations)
+        # Built once; used for both the brief's SOURCES section and the citations field
+        citations_block = "\n".join(f"- {c}" for c in citations)
+        brief = f"{response}\n\n## SOURCES\n{citations_block}" if citations else response
 
         return {
             "research_brief": brief,
             "research_confidence": confidence,
-            "research_citations": "\n".join(f"- {c}" for c in citations),
+            "research_citations": citations_block,
             "research_source_count": len(citations),
             "research_providers": providers_used,
         }
@@ -0,0 +1,41 @@
+"""
+Pydantic models for the structured JSON returned by the LLM.
+
+Validation is deliberately lenient: unknown fields are ignored, missing
+fields fall back to defaults, and numbers are accepted where text is
+expected. Agents still normalize values (clamping, allowed tiers/actions)
+after parsing.
+"""
+
+from typing import Dict, List, Optional, Union
+
+from pydantic import BaseModel, ConfigDict
+
+
+class _LLMOutput(BaseModel):
+    model_config = ConfigDict(extra="ignore", coerce_numbers_to_str=True)
+
+
+class ICPOutput(_LLMOutput):
+    """ICP scoring response (see prompts/icp_prompt.txt)."""
+
+    icp_score: Optional[float] = None
+    dimension_scores: Dict[str, float] = {}
+    confidence_score: float = 0
+    icp_reasoning: Union[str, List[str], None] = None
+    data_gaps: Union[str, List[str], None] = None
+
+
+class PriorityOutput(_LLMOutput):
+    """Priority tier response for ambiguous leads (see prompts/priority_prompt.txt)."""
+
+    priority_tier: Optional[str] = None
+    priority_reasoning: Optional[str] = None
+
+
+class ActionOutput(_LLMOutput):
+    """Next-action response for ambiguous leads (see prompts/action_prompt.txt)."""
+
+    next_action: Optional[str] = None
+    action_reasoning: Optional[str] = None
+    action_confidence: Optional[str] = None
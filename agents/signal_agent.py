@@ -71,6 +71,20 @@ _SIGNAL_RULES = [
 ]
 
 _STRENGTH_RANK = {"none": 0, "low": 1, "medium": 2, "high": 3}
+_MAX_STRENGTH_RANK = max(_STRENGTH_RANK.values())
+
+# Rules compiled once at import: (signal_type, signal_strength, rank, patterns)
+_COMPILED_SIGNAL_RULES = [
+    (
+        rule["signal_type"],
+        rule["signal_strength"],
+        _STRENGTH_RANK.get(rule["signal_strength"], 0),
+        [re.compile(pattern) for pattern in rule["patterns"]],
+    )
+    for rule in _SIGNAL_RULES
+]
+
+_ISO_DATE_RE = re.compile(r"\b\d{4}-\d{2}-\d{2}\b")
 
 
 class SignalAgent:
@@ -130,26 +144,29 @@ class SignalAgent:
         best_rank = -1
         haystack = text.lower()
 
-        for rule in _SIGNAL_RULES:
-            for pattern in rule["patterns"]:
-                match = re.search(pattern, haystack)
+        for signal_type, signal_strength, rank, patterns in _COMPILED_SIGNAL_RULES:
+            # Earlier rules win ties, so only a stronger rule can replace the best.
+            if rank <= best_rank:
+                continue
+            for pattern in patterns:
+                match = pattern.search(haystack)
                 if not match:
                     continue
-                rank = _STRENGTH_RANK.get(rule["signal_strength"], 0)
-                if rank > best_rank:
-                    best_rank = rank
-                    best = {
-                        "signal_type": rule["signal_type"],
-                        "signal_strength": rule["signal_strength"],
-                        "matched_text": match.group(0)[:120],
-                    }
+                best_rank = rank
+                best = {
+                    "signal_type": signal_type,
+                    "signal_strength": signal_strength,
+                    "matched_text": match.group(0)[:120],
+                }
+                break
+            if best_rank >= _MAX_STRENGTH_RANK:
                 break
 
         return best
 
     def _extract_signal_date(self, lead: Dict[str, Any]) -> Optional[str]:
         notes = str(lead.get("notes", "") or "")
-        iso_match = re.search(r"\b\d{4}-\d{2}-\d{2}\b", notes)
+        iso_match = _ISO_DATE_RE.search(notes)
         if iso_match:
             return iso_match.group(0)
 
@@ -48,6 +48,15 @@ class Config:
     INCREMENTAL_ENABLED: bool = os.getenv("INCREMENTAL_ENABLED", "true").lower() in ("true", "1", "yes")
     PIPELINE_STATE_FILE: str = os.getenv("PIPELINE_STATE_FILE", ".pipeline_state.json")
 
+    # --- Throughput ---
+    # Leads analyzed in parallel; each worker mostly waits on Claude and web requests.
+    PIPELINE_CONCURRENCY: int = int(os.getenv("PIPELINE_CONCURRENCY", "4"))
+    # Page writes in flight at once; this overlaps latency but does not cap the rate.
+    NOTION_WRITE_CONCURRENCY: int = int(os.getenv("NOTION_WRITE_CONCURRENCY", "3"))
+    # Notion allows ~3 requests/second per integration; batch writes are paced to this
+    # budget and 429s are retried after the server's Retry-After delay.
+    NOTION_WRITES_PER_SECOND: float = float(os.getenv("NOTION_WRITES_PER_SECOND", "3"))
+
     # --- ICP Criteria (injected into prompt) ---
     ICP_CRITERIA: str = os.getenv(
         "ICP_CRITERIA",
@@ -7,10 +7,14 @@ and writes results back. Supports dry-run mode and result tracking.
 
 import json
 import logging
+import os
 from datetime import datetime, timezone
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterable, List, Optional, Tuple
 
 from config import Config
 from services.notion_service import NotionService
@@ -20,7 +24,8 @@ from services.notification_service import LeadSummary, SlackNotifier
 from agents import ICPAgent, ResearchAgent, SignalAgent, PriorityAgent, ActionAgent
 
 logger = logging.getLogger(__name__)
-_REQUIRED_RESULT_KEYS = ("icp_score", "priority_tier", "next_action")
+# Text outputs that must be non-blank (alongside a valid icp_score) for a lead to count as scored
+_REQUIRED_TEXT_RESULT_KEYS = frozenset({"priority_tier", "next_action"})
 
 # Sample leads for dry-run mode — one strong, one weak
 SAMPLE_LEADS = [
@@ -66,8 +71,14 @@ class PipelineResult:
         return ", ".join(parts)
 
 
+@lru_cache(maxsize=4096)
 def _parse_iso_datetime(value: Optional[str]) -> Optional[datetime]:
-    """Parse an ISO datetime string. Returns None on failure."""
+    """
+    Parse an ISO datetime string. Returns None on failure.
+
+    Cached because bulk imports and edits give many leads the same
+    last_edited_time; datetimes are immutable, so sharing them is safe.
+    """
     if not value:
         return None
     try:
@@ -95,9 +106,12 @@ def _save_last_successful_run(timestamp: datetime) -> None:
     payload = {
         "last_successful_run": timestamp.astimezone(timezone.utc).isoformat(),
     }
+    tmp_path = path.with_name(path.name + ".tmp")
     try:
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(json.dumps(payload, indent=2))
+        # Write then rename so a crash mid-write never leaves a truncated state file.
+        tmp_path.write_text(json.dumps(payload, indent=2))
+        os.replace(tmp_path, path)
     except OSError as exc:
         logger.warning("Could not write pipeline state to %s: %s", path, exc)
 
@@ -119,10 +133,8 @@ def _has_required_outputs(existing_results: Optional[dict]) -> bool:
     icp_score = existing_results.get("icp_score")
     if not isinstance(icp_score, (int, float)) or isinstance(icp_score, bool) or icp_score < 0:
         return False
-    for key in _REQUIRED_RESULT_KEYS[1:]:
-        if _is_blank(existing_results.get(key)):
-            return False
-    return True
+    get = existing_results.get
+    return not any(_is_blank(get(key)) for key in _REQUIRED_TEXT_RESULT_KEYS)
 
 
 def _should_process_lead(
@@ -150,6 +162,144 @@ def _should_process_lead(
     return False, "unchanged since last run"
 
 
+def _select_leads(
+    leads: Iterable[dict],
+    incremental: bool,
+    last_successful_run: Optional[datetime],
+    limit: Optional[int],
+) -> Tuple[List[dict], int]:
+    """
+    Pick the leads to process from a (possibly lazy) stream of Notion rows.
+
+    Stops pulling from the stream once limit leads are selected, so later
+    pages are never fetched. Returns (selected leads, number of rows seen).
+    """
+    selected: List[dict] = []
+    seen = 0
+    for lead in leads:
+        seen += 1
+        if incremental:
+            should_process, reason = _should_process_lead(lead, last_successful_run)
+            if not should_process:
+                logger.debug(
+                    "Skipping %s (%s)",
+                    lead.get("company_name", "Unknown"),
+                    reason,
+                )
+                continue
+        selected.append(lead)
+        if limit and len(selected) >= limit:
+            break
+    return selected, seen
+
+
+@dataclass(frozen=True)
+class _PipelineFlags:
+    """Config switches read once at the start of a run."""
+
+    incremental: bool
+    web_research: bool
+    slack: bool
+    concurrency: int
+
+    @classmethod
+    def from_config(cls) -> "_PipelineFlags":
+        return cls(
+            incremental=Config.INCREMENTAL_ENABLED,
+            web_research=Config.WEB_RESEARCH_ENABLED,
+            slack=Config.SLACK_ENABLED,
+            concurrency=Config.PIPELINE_CONCURRENCY,
+        )
+
+
+@dataclass
+class _AgentChain:
+    """The agents run on every lead, in order. Shared across worker threads."""
+
+    icp: ICPAgent
+    research: ResearchAgent
+    signal: SignalAgent
+    priority: PriorityAgent
+    action: ActionAgent
+
+    def run(self, lead: dict) -> dict:
+        """Run all agents on one lead and return the combined results."""
+        # Run ICP Agent
+        icp_results = self.icp.run(lead)
+
+        # Run Research Agent
+        research_results = self.research.run(lead)
+
+        # Run Signal Agent
+        lead_with_research = {**lead, **research_results}
+        signal_results = self.signal.run(lead_with_research)
+
+        # Enrich lead with context for priority scoring
+        lead_enriched = {**lead, **icp_results, **research_results, **signal_results}
+        priority_results = self.priority.run(lead_enriched)
+
+        # Enrich lead for action recommendation
+        lead_with_priority = {**lead_enriched, **priority_results, **research_results}
+
+        # Run Action Agent
+        action_results = self.action.run(lead_with_priority)
+
+        # Combine all results
+        return {
+            **icp_results,
+            **research_results,
+            **signal_results,
+            **priority_results,
+            **action_results,
+        }
+
+
+def _process_lead(
+    chain: _AgentChain,
+    lead: dict,
+    position: int,
+    total: int,
+) -> Tuple[dict, Optional[dict], Optional[Exception]]:
+    """Run the agent chain on one lead. Returns (lead, results, error); never raises."""
+    company = lead.get("company_name", "Unknown")
+    logger.info("[%d/%d] Processing: %s", position, total, company)
+    try:
+        all_results = chain.run(lead)
+    except Exception as e:
+        logger.error("Error processing %s: %s", company, e)
+        return lead, None, e
+    logger.info("Done: %s", company)
+    return lead, all_results, None
+
+
+def _flush_writes(
+    notion: NotionService,
+    pending_writes: List[tuple],
+    result: PipelineResult,
+) -> None:
+    """Write all processed leads to Notion in one batch and record outcomes."""
+    logger.info("Writing results for %d leads to Notion...", len(pending_writes))
+    try:
+        outcomes = notion.update_leads_batch(
+            [(lead["page_id"], all_results) for lead, all_results, _ in pending_writes]
+        )
+    except Exception as e:
+        logger.error("Batch write to Notion failed: %s", e)
+        outcomes = [False] * len(pending_writes)
+
+    statuses = Counter()
+    for (_, _, summary), success in zip(pending_writes, outcomes):
+        if success:
+            statuses["succeeded"] += 1
+            result.lead_summaries.append(summary)
+        else:
+            statuses["failed"] += 1
+            result.errors.append(f"{summary.company}: failed to write results to Notion")
+            logger.warning("Failed to write results for %s", summary.company)
+    result.succeeded += statuses["succeeded"]
+    result.failed += statuses["failed"]
+
+
 def run_pipeline(
     limit: Optional[int] = None,
     dry_run: bool = False,
@@ -171,8 +321,9 @@ def run_pipeline(
         PipelineResult with counts and error details.
     """
     result = PipelineResult()
+    flags = _PipelineFlags.from_config()
     incremental_mode = (
-        Config.INCREMENTAL_ENABLED
+        flags.incremental
         and not dry_run
         and not full_refresh
     )
@@ -184,22 +335,13 @@ def run_pipeline(
 
     if dry_run:
         logger.info("DRY RUN — using sample leads, skipping Notion writes")
-        leads = SAMPLE_LEADS
+        leads = SAMPLE_LEADS[:limit] if limit else SAMPLE_LEADS
         notion = None
     else:
         notion = NotionService()
         # Validate database access before processing
         notion.validate_database()
 
-        logger.info("Fetching leads from Notion...")
-        leads = notion.fetch_leads()
-
-        if not leads:
-            logger.warning("No leads found in Notion database.")
-            return result
-
-        logger.info("Found %d leads", len(leads))
-
         if incremental_mode:
             last_successful_run = _load_last_successful_run()
             if last_successful_run:
@@ -211,84 +353,74 @@ def run_pipeline(
                 logger.info(
                     "Incremental mode enabled (no previous run state found)."
                 )
-
-            selected = []
-            for lead in leads:
-                should_process, reason = _should_process_lead(lead, last_successful_run)
-                if should_process:
-                    selected.append(lead)
-                else:
-                    result.skipped += 1
-                    logger.debug(
-                        "Skipping %s (%s)",
-                        lead.get("company_name", "Unknown"),
-                        reason,
-                    )
-            leads = selected
-            logger.info(
-                "Incremental selection: %d leads to process, %d skipped",
-                len(leads),
-                result.skipped,
-            )
         elif full_refresh:
             logger.info("Full refresh enabled — processing all leads.")
         else:
             logger.info("Incremental mode disabled — processing all leads.")
 
+        logger.info("Fetching leads from Notion...")
+        leads, seen = _select_leads(
+            notion.fetch_leads(), incremental_mode, last_successful_run, limit
+        )
+
+        if not seen:
+            logger.warning("No leads found in Notion database.")
+            return result
+
+        result.skipped += seen - len(leads)
+        logger.info(
+            "Fetched %d leads: %d to process, %d skipped",
+            seen,
+            len(leads),
+            result.skipped,
+        )
+
     if limit:
-        eligible_count = len(leads)
-        leads = leads[:limit]
-        logger.info("Processing first %d leads (from %d eligible)", len(leads), eligible_count)
+        logger.info("Processing at most %d leads", limit)
 
     # Initialize web research service
     web_research = None
-    if Config.WEB_RESEARCH_ENABLED and not no_web:
+    if flags.web_research and not no_web:
         web_research = WebResearchService()
         logger.info("Web research enabled")
     else:
         logger.info("Web research disabled")
 
-    # Initialize agents
-    icp_agent = ICPAgent(claude)
-    research_agent = ResearchAgent(claude, web_research_service=web_research)
-    signal_agent = SignalAgent(claude)
-    priority_agent = PriorityAgent(claude)
-    action_agent = ActionAgent(claude)
-
-    # Process each lead
-    for i, lead in enumerate(leads, 1):
-        company = lead.get("company_name", "Unknown")
-        logger.info("[%d/%d] Processing: %s", i, len(leads), company)
-
-        try:
-            # Run ICP Agent
-            icp_results = icp_agent.run(lead)
-
-            # Run Research Agent
-            research_results = research_agent.run(lead)
-
-            # Run Signal Agent
-            lead_with_research = {**lead, **research_results}
-            signal_results = signal_agent.run(lead_with_research)
-
-            # Enrich lead with context for priority scoring
-            lead_enriched = {**lead, **icp_results, **research_results, **signal_results}
-            priority_results = priority_agent.run(lead_enriched)
-
-            # Enrich lead for action recommendation
-            lead_with_priority = {**lead_enriched, **priority_results, **research_results}
-
-            # Run Action Agent
-            action_results = action_agent.run(lead_with_priority)
+    # Initialize agents (shared by all worker threads)
+    chain = _AgentChain(
+        icp=ICPAgent(claude),
+        research=ResearchAgent(claude, web_research_service=web_research),
+        signal=SignalAgent(claude),
+        priority=PriorityAgent(claude),
+        action=ActionAgent(claude),
+    )
 
-            # Combine all results
-            all_results = {
-                **icp_results,
-                **research_results,
-                **signal_results,
-                **priority_results,
-                **action_results,
-            }
+    # Results waiting to be written to Notion: (lead, results, summary)
+    pending_writes = []
+    statuses = Counter()
+
+    # Process leads concurrently; agents spend most of their time waiting on
+    # Claude and the web. Outcomes are consumed in input order.
+    workers = max(1, min(flags.concurrency, len(leads)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        outcomes = executor.map(
+            partial(_process_lead, chain, total=len(leads)),
+            leads,
+            range(1, len(leads) + 1),
+        )
+        for lead, all_results, error in outcomes:
+            company = lead.get("company_name", "Unknown")
+            if error is not None:
+                statuses["failed"] += 1
+                result.errors.append(f"{company}: {error}")
+                continue
+
+            summary = LeadSummary(
+                company=company,
+                icp_score=all_results.get("icp_score", -1),
+                priority_tier=all_results.get("priority_tier", "review"),
+                stale=all_results.get("stale_flag", False),
+            )
 
             # Write back to Notion (skip in dry-run)
             if dry_run:
@@ -296,26 +428,19 @@ def run_pipeline(
                     k: (v[:80] + "...") if isinstance(v, str) and len(v) > 80 else v
                     for k, v in all_results.items()
                 })
+                statuses["succeeded"] += 1
+                result.lead_summaries.append(summary)
             else:
-                success = notion.update_lead(lead["page_id"], all_results)
-                if not success:
-                    logger.warning("Failed to write results for %s", company)
+                pending_writes.append((lead, all_results, summary))
 
-            result.succeeded += 1
-            result.lead_summaries.append(LeadSummary(
-                company=company,
-                icp_score=icp_results.get("icp_score", -1),
-                priority_tier=priority_results.get("priority_tier", "review"),
-                stale=priority_results.get("stale_flag", False),
-            ))
-            logger.info("Done: %s", company)
-
-        except Exception as e:
-            result.failed += 1
-            error_msg = f"{company}: {e}"
-            result.errors.append(error_msg)
-            logger.error("Error processing %s: %s", company, e)
-            continue
+    result.succeeded += statuses["succeeded"]
+    result.failed += statuses["failed"]
+
+    if web_research is not None:
+        web_research.close()
+
+    if pending_writes:
+        _flush_writes(notion, pending_writes, result)
 
     # Summary
     logger.info("Pipeline complete — %s", result.summary())
@@ -324,7 +449,7 @@ def run_pipeline(
         for err in result.errors:
             logger.info("  - %s", err)
 
-    if not dry_run and Config.INCREMENTAL_ENABLED:
+    if not dry_run and flags.incremental:
         if result.failed == 0:
             _save_last_successful_run(datetime.now(timezone.utc))
         else:
@@ -334,7 +459,7 @@ def run_pipeline(
             )
 
     # Slack notification
-    if notify_slack or Config.SLACK_ENABLED:
+    if notify_slack or flags.slack:
         webhook_url = Config.SLACK_WEBHOOK_URL
         if webhook_url:
             notifier = SlackNotifier(webhook_url)
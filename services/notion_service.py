@@ -5,9 +5,14 @@ Handles fetching leads with pagination, updating pages, and
 database validation with clear error messages.
 """
 
+import sys
 import time
+import hashlib
 import logging
-from typing import List, Dict, Any, Optional
+import threading
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 
 from notion_client import Client, APIResponseError
 
@@ -17,10 +22,27 @@ logger = logging.getLogger(__name__)
 
 _MAX_RETRIES = 3
 _BASE_DELAY = 1.0
+# Cap on a server-requested Retry-After wait, so a bad header can't stall a writer
+_MAX_RETRY_AFTER = 60.0
+
+
+def _retry_after_seconds(error: APIResponseError) -> Optional[float]:
+    """Seconds the server asked us to wait (Retry-After header), if given, capped."""
+    headers = getattr(error, "headers", None)
+    value = headers.get("retry-after") if headers else None
+    try:
+        return min(max(0.0, float(value)), _MAX_RETRY_AFTER) if value is not None else None
+    except ValueError:
+        return None
 
 
 def _retry(func):
-    """Decorator: retry on transient Notion API errors with exponential backoff."""
+    """
+    Decorator: retry on transient Notion API errors.
+
+    Waits as long as a 429's Retry-After header asks (up to _MAX_RETRY_AFTER),
+    otherwise backs off exponentially.
+    """
     def wrapper(*args, **kwargs):
         last_error = None
         for attempt in range(_MAX_RETRIES):
@@ -29,7 +51,9 @@ def _retry(func):
             except APIResponseError as e:
                 if e.status in (429, 500, 502, 503):
                     last_error = e
-                    delay = _BASE_DELAY * (2 ** attempt)
+                    delay = _retry_after_seconds(e) if e.status == 429 else None
+                    if delay is None:
+                        delay = _BASE_DELAY * (2 ** attempt)
                     logger.warning(
                         "Notion API %d (attempt %d/%d), retrying in %.1fs...",
                         e.status, attempt + 1, _MAX_RETRIES, delay,
@@ -41,6 +65,173 @@ def _retry(func):
     return wrapper
 
 
+class _RequestPacer:
+    """Spaces out request starts across threads to stay under a per-second budget."""
+
+    def __init__(self, requests_per_second: float):
+        self._interval = 1.0 / requests_per_second if requests_per_second > 0 else 0.0
+        self._next_start = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        """Block until the next request may start."""
+        if not self._interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + self._interval
+        if start > now:
+            time.sleep(start - now)
+
+
+# Canonical output key -> Config attribute holding its Notion column name
+_OUTPUT_PROPERTY_SETTINGS = (
+    ("icp_score", "NOTION_PROP_ICP_SCORE"),
+    ("confidence_score", "NOTION_PROP_CONFIDENCE"),
+    ("icp_reasoning", "NOTION_PROP_ICP_REASONING"),
+    ("research_brief", "NOTION_PROP_RESEARCH_BRIEF"),
+    ("research_confidence", "NOTION_PROP_RESEARCH_CONFIDENCE"),
+    ("research_citations", "NOTION_PROP_RESEARCH_CITATIONS"),
+    ("research_source_count", "NOTION_PROP_RESEARCH_SOURCE_COUNT"),
+    ("research_providers", "NOTION_PROP_RESEARCH_PROVIDERS"),
+    ("signal_type", "NOTION_PROP_SIGNAL_TYPE"),
+    ("signal_strength", "NOTION_PROP_SIGNAL_STRENGTH"),
+    ("signal_date", "NOTION_PROP_SIGNAL_DATE"),
+    ("signal_reasoning", "NOTION_PROP_SIGNAL_REASONING"),
+    ("priority_tier", "NOTION_PROP_PRIORITY_TIER"),
+    ("priority_reasoning", "NOTION_PROP_PRIORITY_REASONING"),
+    ("stale_flag", "NOTION_PROP_STALE_FLAG"),
+    ("next_action", "NOTION_PROP_NEXT_ACTION"),
+    ("action_reasoning", "NOTION_PROP_ACTION_REASONING"),
+    ("action_confidence", "NOTION_PROP_ACTION_CONFIDENCE"),
+)
+_OUTPUT_PROPERTY_KEYS = tuple(key for key, _ in _OUTPUT_PROPERTY_SETTINGS)
+
+
+@lru_cache(maxsize=8)
+def _build_output_property_map(column_names: Tuple[str, ...]) -> Dict[str, str]:
+    """Build the canonical -> column mapping once per distinct set of column names."""
+    return dict(zip(_OUTPUT_PROPERTY_KEYS, column_names))
+
+
+# Database schemas shared across NotionService instances in this process,
+# keyed by (api key digest, database id) -> (expires_at, properties).
+_SCHEMA_CACHE: Dict[Tuple[bytes, str], Tuple[float, Dict[str, Dict[str, Any]]]] = {}
+_SCHEMA_CACHE_TTL = 600.0
+
+
+def _intern_name(name: Any) -> Any:
+    """
+    Intern select/status option names.
+
+    Every page decodes its own copy of values like "Qualified" or "high";
+    interning lets all leads share one string per option.
+    """
+    return sys.intern(name) if isinstance(name, str) else name
+
+
+# --- Property readers ---
+# Each takes a Notion property object and returns a plain Python value.
+
+def _read_option_name(option: Optional[Dict[str, Any]]) -> Optional[str]:
+    return _intern_name(option.get("name")) if option else None
+
+
+def _read_plain_text(items: List[Dict[str, Any]]) -> str:
+    return " ".join(item.get("plain_text", "") for item in items).strip()
+
+
+def _read_date(prop: Dict[str, Any]) -> Optional[str]:
+    date_obj = prop.get("date")
+    return date_obj.get("start") if date_obj else None
+
+
+def _read_multi_select(prop: Dict[str, Any]) -> List[str]:
+    return [
+        _intern_name(item["name"]) for item in prop.get("multi_select", []) if item.get("name")
+    ]
+
+
+# Notion property type -> reader. Unlisted types read as None.
+_PROPERTY_READERS = {
+    "number": lambda prop: prop.get("number"),
+    "checkbox": lambda prop: prop.get("checkbox"),
+    "select": lambda prop: _read_option_name(prop.get("select")),
+    "status": lambda prop: _read_option_name(prop.get("status")),
+    "url": lambda prop: prop.get("url"),
+    "date": _read_date,
+    "title": lambda prop: _read_plain_text(prop.get("title", [])),
+    "rich_text": lambda prop: _read_plain_text(prop.get("rich_text", [])),
+    "multi_select": _read_multi_select,
+}
+
+
+# --- Output formatters ---
+# Each takes a plain Python value and returns the Notion property payload,
+# or None when the value does not fit the column type and should be skipped.
+
+def _format_number(value: Any) -> Optional[Dict[str, Any]]:
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return {"number": value}
+    return None
+
+
+def _format_checkbox(value: Any) -> Optional[Dict[str, Any]]:
+    if isinstance(value, bool):
+        return {"checkbox": value}
+    return None
+
+
+def _format_select(value: Any) -> Optional[Dict[str, Any]]:
+    if isinstance(value, str) and value.strip():
+        return {"select": {"name": value.strip()[:100]}}
+    return None
+
+
+def _format_status(value: Any) -> Optional[Dict[str, Any]]:
+    if isinstance(value, str) and value.strip():
+        return {"status": {"name": value.strip()[:100]}}
+    return None
+
+
+def _format_url(value: Any) -> Optional[Dict[str, Any]]:
+    if isinstance(value, str) and value.strip():
+        return {"url": value.strip()}
+    return None
+
+
+def _format_date(value: Any) -> Optional[Dict[str, Any]]:
+    if isinstance(value, str) and value.strip():
+        return {"date": {"start": value.strip()}}
+    return None
+
+
+def _format_title(value: Any) -> Optional[Dict[str, Any]]:
+    if isinstance(value, str):
+        return {"title": [{"text": {"content": value[:2000]}}]}
+    return None
+
+
+def _format_rich_text(value: Any) -> Optional[Dict[str, Any]]:
+    if isinstance(value, str):
+        return {"rich_text": [{"text": {"content": value[:2000]}}]}
+    return None
+
+
+# Notion property type -> formatter. Unlisted types are written as rich_text.
+_FORMATTERS = {
+    "number": _format_number,
+    "checkbox": _format_checkbox,
+    "select": _format_select,
+    "status": _format_status,
+    "url": _format_url,
+    "date": _format_date,
+    "title": _format_title,
+    "rich_text": _format_rich_text,
+}
+
+
 class NotionService:
     """Service for interacting with Notion CRM database."""
 
@@ -53,6 +244,10 @@ class NotionService:
         self.database_id = database_id or Config.NOTION_DATABASE_ID
         self.client = Client(auth=self.api_key)
         self._database_properties_cache: Optional[Dict[str, Dict[str, Any]]] = None
+        self._schema_cache_key = (
+            hashlib.blake2b((self.api_key or "").encode(), digest_size=8).digest(),
+            self.database_id,
+        )
 
     def validate_database(self) -> None:
         """
@@ -94,29 +289,30 @@ class NotionService:
                 "See NOTION_SETUP.md for the required schema.",
                 ", ".join(sorted(missing)),
             )
-        self._database_properties_cache = db.get("properties", {})
+        self._store_database_properties(db.get("properties", {}))
 
     @_retry
     def _retrieve_database(self) -> Dict:
         return self.client.databases.retrieve(database_id=self.database_id)
 
-    def fetch_leads(self, filter_dict: Optional[Dict] = None) -> List[Dict[str, Any]]:
-        """Fetch all leads with automatic pagination."""
-        leads = []
+    def fetch_leads(self, filter_dict: Optional[Dict] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Yield leads one at a time, following pagination lazily.
+
+        The next page is only requested once the caller has consumed the
+        current one, so stopping early skips the remaining queries.
+        """
         start_cursor = None
 
         while True:
             response = self._query_database(filter_dict, start_cursor)
             for page in response.get("results", []):
-                lead = self._extract_lead_from_page(page)
-                leads.append(lead)
+                yield self._extract_lead_from_page(page)
 
             if not response.get("has_more"):
                 break
             start_cursor = response.get("next_cursor")
 
-        return leads
-
     @_retry
     def _query_database(
         self,
@@ -143,6 +339,51 @@ class NotionService:
             logger.error("Failed to update page %s: %s", page_id, e)
             return False
 
+    def update_leads_batch(self, updates: List[Tuple[str, Dict[str, Any]]]) -> List[bool]:
+        """
+        Update several Notion pages, overlapping request latency.
+
+        Properties are formatted up front; page writes then run concurrently,
+        bounded by Config.NOTION_WRITE_CONCURRENCY, and start no faster than
+        Config.NOTION_WRITES_PER_SECOND.
+
+        Returns:
+            One success flag per update, in input order.
+        """
+        if not updates:
+            return []
+
+        # Format on the calling thread so the schema cache is filled once.
+        prepared = [
+            (page_id, self._prepare_update_properties(properties))
+            for page_id, properties in updates
+        ]
+        pacer = _RequestPacer(Config.NOTION_WRITES_PER_SECOND)
+        workers = max(1, min(Config.NOTION_WRITE_CONCURRENCY, len(prepared)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(
+                executor.map(lambda item: self._write_page(*item, pacer=pacer), prepared)
+            )
+
+    def _write_page(
+        self,
+        page_id: str,
+        notion_properties: Dict,
+        pacer: Optional[_RequestPacer] = None,
+    ) -> bool:
+        """Write already-formatted properties; never raises."""
+        if not notion_properties:
+            logger.warning("No valid output properties to write for page %s", page_id)
+            return True
+        try:
+            if pacer is not None:
+                pacer.wait()
+            self._update_page(page_id, notion_properties)
+            return True
+        except Exception as e:
+            logger.error("Failed to update page %s: %s", page_id, e)
+            return False
+
     @_retry
     def _update_page(self, page_id: str, notion_properties: Dict) -> None:
         self.client.pages.update(page_id=page_id, properties=notion_properties)
@@ -164,33 +405,50 @@ class NotionService:
         }
 
     def _prepare_update_properties(self, properties: Dict[str, Any]) -> Dict:
-        """Map canonical keys, drop unknown columns, then format per Notion schema."""
-        mapped = self._map_output_property_names(properties)
-        return self._format_properties_for_notion(mapped)
+        """
+        Convert canonical result keys to configured Notion property names and
+        format each value using schema-aware typing.
+
+        Keys that aren't output keys are used as property names unchanged.
+        Properties missing from the database schema are skipped, and output
+        follows input order.
+        """
+        key_map = self._output_property_map()
+        db_props = self._get_database_properties()
+        get_formatter = _FORMATTERS.get
+        notion_props = {}
+
+        names = [key_map.get(key, key) for key in properties]
+        # Columns the database actually has, found with one set intersection
+        known = db_props.keys() & names
+        if len(known) < len(names) and logger.isEnabledFor(logging.DEBUG):
+            for name in set(names) - known:
+                logger.debug("Skipping unknown Notion property: %s", name)
+
+        for name, value in zip(names, properties.values()):
+            if name not in known:
+                continue
+            if value is None:
+                notion_props.pop(name, None)
+                continue
+            formatted = get_formatter(db_props[name].get("type"), _format_rich_text)(value)
+            if formatted is None:
+                notion_props.pop(name, None)
+            else:
+                notion_props[name] = formatted
+        return notion_props
 
     @staticmethod
     def _output_property_map() -> Dict[str, str]:
-        """Canonical output keys -> configured Notion column names."""
-        return {
-            "icp_score": Config.NOTION_PROP_ICP_SCORE,
-            "confidence_score": Config.NOTION_PROP_CONFIDENCE,
-            "icp_reasoning": Config.NOTION_PROP_ICP_REASONING,
-            "research_brief": Config.NOTION_PROP_RESEARCH_BRIEF,
-            "research_confidence": Config.NOTION_PROP_RESEARCH_CONFIDENCE,
-            "research_citations": Config.NOTION_PROP_RESEARCH_CITATIONS,
-            "research_source_count": Config.NOTION_PROP_RESEARCH_SOURCE_COUNT,
-            "research_providers": Config.NOTION_PROP_RESEARCH_PROVIDERS,
-            "signal_type": Config.NOTION_PROP_SIGNAL_TYPE,
-            "signal_strength": Config.NOTION_PROP_SIGNAL_STRENGTH,
-            "signal_date": Config.NOTION_PROP_SIGNAL_DATE,
-            "signal_reasoning": Config.NOTION_PROP_SIGNAL_REASONING,
-            "priority_tier": Config.NOTION_PROP_PRIORITY_TIER,
-            "priority_reasoning": Config.NOTION_PROP_PRIORITY_REASONING,
-            "stale_flag": Config.NOTION_PROP_STALE_FLAG,
-            "next_action": Config.NOTION_PROP_NEXT_ACTION,
-            "action_reasoning": Config.NOTION_PROP_ACTION_REASONING,
-            "action_confidence": Config.NOTION_PROP_ACTION_CONFIDENCE,
-        }
+        """
+        Canonical output keys -> configured Notion column names.
+
+        The mapping is cached per Config snapshot and shared between callers,
+        so treat it as read-only.
+        """
+        return _build_output_property_map(
+            tuple(getattr(Config, attr) for _, attr in _OUTPUT_PROPERTY_SETTINGS)
+        )
 
     @staticmethod
     def _output_property_schema() -> Dict[str, Dict[str, Any]]:
@@ -271,20 +529,13 @@ class NotionService:
             },
         }
 
-    def _map_output_property_names(self, properties: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Convert canonical result keys to configured Notion property names.
-        Unknown keys are left unchanged and may be filtered later.
-        """
-        key_map = self._output_property_map()
-        return {key_map.get(key, key): value for key, value in properties.items()}
-
     def _extract_existing_results(self, props: Dict[str, Any]) -> Dict[str, Any]:
         """Extract existing output values from a Notion row into canonical keys."""
         values: Dict[str, Any] = {}
+        read = self._read_property_value
         for canonical_key, notion_prop_name in self._output_property_map().items():
             prop = props.get(notion_prop_name)
-            values[canonical_key] = self._read_property_value(prop) if prop else None
+            values[canonical_key] = read(prop) if prop else None
         return values
 
     def bootstrap_output_properties(self) -> List[str]:
@@ -301,9 +552,14 @@ class NotionService:
         if not missing:
             return []
 
-        self._update_database_properties(missing)
+        response = self._update_database_properties(missing)
         # Refresh cached schema so later writes use new columns immediately.
-        self._database_properties_cache = self._retrieve_database().get("properties", {})
+        # The update response already carries the full schema; only fall back
+        # to a second round-trip when it doesn't.
+        updated_props = (response or {}).get("properties")
+        if not updated_props:
+            updated_props = self._retrieve_database().get("properties", {})
+        self._store_database_properties(updated_props)
         return list(missing.keys())
 
     @_retry
@@ -315,81 +571,39 @@ class NotionService:
         )
 
     def _get_database_properties(self) -> Dict[str, Dict[str, Any]]:
-        """Get Notion database properties with lightweight caching."""
+        """
+        Get Notion database properties with lightweight caching.
+
+        Checks this instance first, then the process-wide schema cache, and
+        only calls the API when both miss or the shared entry has expired.
+        """
         if self._database_properties_cache is not None:
             return self._database_properties_cache
+        entry = _SCHEMA_CACHE.get(self._schema_cache_key)
+        if entry and entry[0] > time.monotonic():
+            self._database_properties_cache = entry[1]
+            return entry[1]
         db = self._retrieve_database()
-        self._database_properties_cache = db.get("properties", {})
-        return self._database_properties_cache
-
-    def _format_properties_for_notion(self, properties: Dict[str, Any]) -> Dict:
-        """Convert a simple dict to Notion property format using schema-aware typing."""
-        notion_props = {}
-        db_props = self._get_database_properties()
-
-        for key, value in properties.items():
-            if value is None:
-                continue
-            if key not in db_props:
-                logger.debug("Skipping unknown Notion property: %s", key)
-                continue
-
-            prop_type = db_props[key].get("type")
-            if prop_type == "number":
-                if isinstance(value, (int, float)) and not isinstance(value, bool):
-                    notion_props[key] = {"number": value}
-            elif prop_type == "checkbox":
-                if isinstance(value, bool):
-                    notion_props[key] = {"checkbox": value}
-            elif prop_type == "select":
-                if isinstance(value, str) and value.strip():
-                    notion_props[key] = {"select": {"name": value.strip()[:100]}}
-            elif prop_type == "status":
-                if isinstance(value, str) and value.strip():
-                    notion_props[key] = {"status": {"name": value.strip()[:100]}}
-            elif prop_type == "url":
-                if isinstance(value, str) and value.strip():
-                    notion_props[key] = {"url": value.strip()}
-            elif prop_type == "date":
-                if isinstance(value, str) and value.strip():
-                    notion_props[key] = {"date": {"start": value.strip()}}
-            elif prop_type == "title":
-                if isinstance(value, str):
-                    notion_props[key] = {"title": [{"text": {"content": value[:2000]}}]}
-            else:
-                # Default text-like output to rich_text.
-                if isinstance(value, str):
-                    notion_props[key] = {"rich_text": [{"text": {"content": value[:2000]}}]}
-        return notion_props
+        return self._store_database_properties(db.get("properties", {}))
+
+    def _store_database_properties(
+        self, properties: Dict[str, Dict[str, Any]]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Cache a freshly fetched schema on this instance and process-wide."""
+        self._database_properties_cache = properties
+        _SCHEMA_CACHE[self._schema_cache_key] = (
+            time.monotonic() + _SCHEMA_CACHE_TTL,
+            properties,
+        )
+        return properties
 
     # --- Property helpers ---
 
     @staticmethod
     def _read_property_value(prop: Dict[str, Any]) -> Any:
         """Return a simple Python value from a Notion property object."""
-        prop_type = prop.get("type")
-        if prop_type == "number":
-            return prop.get("number")
-        if prop_type == "checkbox":
-            return prop.get("checkbox")
-        if prop_type == "select":
-            select_obj = prop.get("select")
-            return select_obj.get("name") if select_obj else None
-        if prop_type == "status":
-            status_obj = prop.get("status")
-            return status_obj.get("name") if status_obj else None
-        if prop_type == "url":
-            return prop.get("url")
-        if prop_type == "date":
-            date_obj = prop.get("date")
-            return date_obj.get("start") if date_obj else None
-        if prop_type == "title":
-            return " ".join(item.get("plain_text", "") for item in prop.get("title", [])).strip()
-        if prop_type == "rich_text":
-            return " ".join(item.get("plain_text", "") for item in prop.get("rich_text", [])).strip()
-        if prop_type == "multi_select":
-            return [item.get("name", "") for item in prop.get("multi_select", []) if item.get("name")]
-        return None
+        reader = _PROPERTY_READERS.get(prop.get("type"))
+        return reader(prop) if reader else None
 
     @staticmethod
     def _get_title(prop: Dict) -> str:
@@ -418,5 +632,5 @@ class NotionService:
     def _get_select(prop: Dict) -> str:
         select_obj = prop.get("select")
         if select_obj:
-            return select_obj.get("name", "")
+            return _intern_name(select_obj.get("name", ""))
         return ""
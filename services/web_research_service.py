@@ -6,13 +6,19 @@ respects robots.txt, and provides in-memory caching.
 """
 
 import logging
+import re
+import threading
 import time
 import urllib.robotparser
-from typing import Any, Dict, List, Optional
-from urllib.parse import urljoin, urlparse
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urljoin, urlparse, urlunparse
 
 import httpx
-from bs4 import BeautifulSoup
+import lxml.html
+from lxml import etree
 
 from config import Config
 
@@ -21,32 +27,156 @@ logger = logging.getLogger(__name__)
 # Tags whose content is not useful for research
 _STRIP_TAGS = {"script", "style", "nav", "footer", "header", "aside", "form", "noscript", "iframe"}
 
+# Text nodes of the page title and body, in document order. Everything else
+# in <head> (meta, link, inline scripts) is ignored.
+_CONTENT_TEXT_XPATH = etree.XPath("//title//text() | //body//text()", smart_strings=False)
+
+# A line with at least 3 non-blank characters, captured without its
+# surrounding whitespace. Shorter lines are usually UI fragments.
+_MEANINGFUL_LINE_RE = re.compile(r"^[^\S\n]*(\S[^\n]+\S)[^\S\n]*$", re.MULTILINE)
+_REPEATED_SLASHES_RE = re.compile(r"/{2,}")
+
+# Query parameters that only track the click source and never change page content
+_TRACKING_PARAMS = {"fbclid", "gclid", "ref"}
+
 # Max characters to keep from scraped content (~3000 tokens)
 _MAX_CONTENT_CHARS = 12_000
 
+# Stop downloading a page after this many bytes; the text is truncated to
+# _MAX_CONTENT_CHARS anyway, so the rest of a huge page is never used.
+_MAX_PAGE_BYTES = 2_000_000
+
+# HTTP failures that degrade to "no content" instead of failing the lead.
+# Timeouts, connection and decoding errors are all RequestError subclasses.
+_RECOVERABLE = (httpx.HTTPStatusError, httpx.RequestError)
+
 # Subpages to try scraping beyond the homepage
 _SUBPAGES = ["/about", "/pricing", "/blog"]
-_SUPPORTED_PROVIDERS = ("website", "brave")
+_MAX_REQUESTS_PER_LEAD = 5
+_DEFAULT_PROVIDER_ORDER = ("website", "brave")
+_SUPPORTED_PROVIDERS = frozenset(_DEFAULT_PROVIDER_ORDER)
+# A supported provider name filling a whole comma-separated item
+_PROVIDER_ITEM_RE = re.compile(
+    r"(?:^|,)\s*(" + "|".join(sorted(_SUPPORTED_PROVIDERS)) + r")\s*(?=,|$)", re.IGNORECASE
+)
+
+# Page cache bounds: entries are evicted LRU-2 style past the size limit,
+# and entries older than the TTL are refetched.
+_PAGE_CACHE_MAX_ENTRIES = 256
+_PAGE_CACHE_TTL_SECONDS = 3600.0
+
+# Parsed robots.txt rules, one entry per origin (scheme://host)
+_ROBOTS_CACHE_MAX_ENTRIES = 128
+_ROBOTS_CACHE_TTL_SECONDS = 3600.0
+
+# Cache lookup default that can't collide with a stored value (including None)
+_MISSING = object()
+
+
+@lru_cache(maxsize=2048)
+def _split(url: str) -> Tuple[str, str, str]:
+    """(scheme, netloc, path) of a URL, memoized: a site's pages are checked repeatedly."""
+    parsed = urlparse(url)
+    return parsed.scheme, parsed.netloc, parsed.path
+
+
+class _LRU2Cache:
+    """
+    Thread-safe LRU-2 cache with a per-entry TTL.
+
+    Eviction removes the entry whose second-most-recent access is oldest.
+    Entries seen only once count as never accessed twice, so they go first,
+    least recently used first. A run of one-off lead URLs therefore can't
+    push out pages that are requested repeatedly (homepages, shared hosts),
+    as it would under plain LRU. Expired entries are purged before any live
+    entry is considered, however often they were accessed.
+
+    Supports the subset of the dict interface the service uses:
+    get(), item assignment, `in` and len().
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # key -> [value, expires_at, previous access tick, last access tick]
+        self._entries: Dict[str, List[Any]] = {}
+        # Logical clock; unlike wall time it never ties or goes backwards.
+        self._tick = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            if entry[1] <= time.monotonic():
+                del self._entries[key]
+                return default
+            self._tick += 1
+            entry[2], entry[3] = entry[3], self._tick
+            return entry[0]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        with self._lock:
+            entries = self._entries
+            self._tick += 1
+            expires_at = time.monotonic() + self.ttl
+            entry = entries.get(key)
+            if entry is not None:
+                entry[0], entry[1] = value, expires_at
+                entry[2], entry[3] = entry[3], self._tick
+                return
+            if len(entries) >= self.maxsize:
+                now = time.monotonic()
+                for expired in [k for k, e in entries.items() if e[1] <= now]:
+                    del entries[expired]
+            if len(entries) >= self.maxsize:
+                victim = min(entries, key=lambda k: (entries[k][2], entries[k][3]))
+                del entries[victim]
+            entries[key] = [value, expires_at, 0, self._tick]
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and entry[1] > time.monotonic()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class _LeadRequests:
+    """Request accounting for one lead, shared by the threads fetching its pages."""
+
+    def __init__(self):
+        self.count = 0
+        self._next_start = 0.0
+        self._lock = threading.Lock()
 
+    def reserve(self, delay: float) -> float:
+        """
+        Count a new request and return how long to wait before starting it.
+
+        The first request starts immediately; each later one starts at least
+        `delay` seconds after the previous start.
+        """
+        with self._lock:
+            now = time.monotonic()
+            start = now if self.count == 0 else max(now, self._next_start)
+            self._next_start = start + delay
+            self.count += 1
+            return start - now
 
+
+@dataclass
 class WebResearchResult:
     """Structured result from web research for a single lead."""
 
-    def __init__(
-        self,
-        website_content: str = "",
-        search_results: str = "",
-        pages_fetched: int = 0,
-        source_urls: Optional[List[str]] = None,
-        provider_trace: Optional[List[Dict[str, Any]]] = None,
-        errors: Optional[List[str]] = None,
-    ):
-        self.website_content = website_content
-        self.search_results = search_results
-        self.pages_fetched = pages_fetched
-        self.source_urls = source_urls or []
-        self.provider_trace = provider_trace or []
-        self.errors = errors or []
+    website_content: str = ""
+    search_results: str = ""
+    pages_fetched: int = 0
+    source_urls: List[str] = field(default_factory=list)
+    provider_trace: List[Dict[str, Any]] = field(default_factory=list)
+    errors: List[str] = field(default_factory=list)
 
     @property
     def has_content(self) -> bool:
@@ -101,9 +231,47 @@ class WebResearchService:
             if run_all_providers is not None
             else Config.WEB_RESEARCH_RUN_ALL_PROVIDERS
         )
-        self._cache: Dict[str, str] = {}
-        self._robot_parsers: Dict[str, urllib.robotparser.RobotFileParser] = {}
-        self._request_count = 0
+        self._cache = _LRU2Cache(_PAGE_CACHE_MAX_ENTRIES, _PAGE_CACHE_TTL_SECONDS)
+        # origin -> RobotFileParser, or None when robots.txt couldn't be read
+        self._robot_parsers = _LRU2Cache(_ROBOTS_CACHE_MAX_ENTRIES, _ROBOTS_CACHE_TTL_SECONDS)
+        # Per-lead request accounting; leads may be researched on parallel threads.
+        self._local = threading.local()
+        # One pooled client for the service's lifetime, so subpages and later
+        # leads on the same host reuse connections instead of new TLS handshakes.
+        self._client = httpx.Client(
+            timeout=self.timeout,
+            headers={"User-Agent": "NotionCRMBot/1.0 (lead research)"},
+        )
+
+    def close(self) -> None:
+        """Close pooled HTTP connections."""
+        self._client.close()
+
+    @property
+    def provider_order(self) -> List[str]:
+        """Providers to run, in waterfall order."""
+        return self._provider_order
+
+    @provider_order.setter
+    def provider_order(self, order: List[str]) -> None:
+        self._provider_order = list(order)
+        # Resolve each provider to its runner and the lead field it reads once,
+        # instead of dispatching on the provider name for every lead.
+        runners = {
+            "website": (self._run_website_provider, "website"),
+            "brave": (self._run_brave_provider, "company_name"),
+        }
+        self._provider_runners = tuple(
+            runners[provider] for provider in self._provider_order if provider in runners
+        )
+
+    @property
+    def _lead_requests(self) -> "_LeadRequests":
+        """Request accounting for the lead currently being researched on this thread."""
+        lead = getattr(self._local, "lead", None)
+        if lead is None:
+            lead = self._local.lead = _LeadRequests()
+        return lead
 
     def research_lead(self, lead: Dict[str, Any]) -> WebResearchResult:
         """
@@ -112,33 +280,27 @@ class WebResearchService:
         Scrapes the lead's website and optionally runs a Brave search.
         Returns a WebResearchResult with all gathered content.
         """
-        self._request_count = 0
+        self._local.lead = _LeadRequests()
         result = WebResearchResult()
 
-        website = lead.get("website", "")
-        company_name = lead.get("company_name", "")
-        for provider in self.provider_order:
-            if provider == "website":
-                self._run_website_provider(result, website)
-            elif provider == "brave":
-                self._run_brave_provider(result, company_name)
-
-            if (
-                not self.run_all_providers
-                and self._combined_chars(result) >= self.target_chars
-            ):
-                result.provider_trace.append(
-                    {
-                        "provider": "waterfall",
-                        "status": "stop_threshold_reached",
-                        "combined_chars": self._combined_chars(result),
-                        "target_chars": self.target_chars,
-                    }
-                )
-                break
-
-        # Deduplicate while preserving order
-        result.source_urls = list(dict.fromkeys(result.source_urls))
+        get = lead.get
+        stop_early = not self.run_all_providers
+        target_chars = self.target_chars
+        for run_provider, lead_field in self._provider_runners:
+            run_provider(result, get(lead_field, ""))
+
+            if stop_early:
+                combined_chars = self._combined_chars(result)
+                if combined_chars >= target_chars:
+                    result.provider_trace.append(
+                        {
+                            "provider": "waterfall",
+                            "status": "stop_threshold_reached",
+                            "combined_chars": combined_chars,
+                            "target_chars": target_chars,
+                        }
+                    )
+                    break
 
         return result
 
@@ -154,8 +316,8 @@ class WebResearchService:
             if content:
                 truncated = self._truncate(content)
                 result.website_content = truncated
-                result.pages_fetched = self._request_count
-                result.source_urls.append(url)
+                result.pages_fetched = self._lead_requests.count
+                self._add_source_urls(result, [url])
                 result.provider_trace.append(
                     {
                         "provider": "website",
@@ -191,7 +353,7 @@ class WebResearchService:
             search_content, search_urls = self._brave_search(company_name)
             if search_content:
                 result.search_results = search_content
-                result.source_urls.extend(search_urls)
+                self._add_source_urls(result, search_urls)
                 result.provider_trace.append(
                     {
                         "provider": "brave",
@@ -211,20 +373,28 @@ class WebResearchService:
                 {"provider": "brave", "status": "error", "error": str(exc)}
             )
 
+    @staticmethod
+    def _add_source_urls(result: WebResearchResult, urls: List[str]) -> None:
+        """Append source URLs in order, skipping any already recorded."""
+        seen = set(result.source_urls)
+        for url in urls:
+            if url not in seen:
+                seen.add(url)
+                result.source_urls.append(url)
+
     @staticmethod
     def _combined_chars(result: WebResearchResult) -> int:
         return len(result.website_content or "") + len(result.search_results or "")
 
     @staticmethod
     def _parse_provider_order(raw: str) -> List[str]:
-        providers = []
-        for item in (raw or "").split(","):
-            normalized = item.strip().lower()
-            if normalized in _SUPPORTED_PROVIDERS and normalized not in providers:
-                providers.append(normalized)
-        return providers or ["website", "brave"]
+        # One regex pass picks the supported names; dict.fromkeys dedupes in order.
+        found = _PROVIDER_ITEM_RE.findall(raw or "")
+        providers = list(dict.fromkeys(name.lower() for name in found))
+        return providers or list(_DEFAULT_PROVIDER_ORDER)
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _normalize_url(url: str) -> str:
         """Ensure URL has a scheme and no trailing slash."""
         url = url.strip()
@@ -234,130 +404,257 @@ class WebResearchService:
             url = "https://" + url
         return url.rstrip("/")
 
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _canonical_url(url: str) -> str:
+        """
+        Build a cache key that treats trivially different URLs as the same page.
+
+        Lowercases scheme and host, drops the fragment and tracking parameters,
+        sorts the query, collapses repeated slashes, and strips a trailing slash.
+        """
+        parsed = urlparse(url.strip())
+        path = _REPEATED_SLASHES_RE.sub("/", parsed.path).rstrip("/") or "/"
+        query = urlencode(
+            sorted(
+                (key, value)
+                for key, value in parse_qsl(parsed.query, keep_blank_values=True)
+                if key.lower() not in _TRACKING_PARAMS
+                and not key.lower().startswith("utm_")
+            )
+        )
+        return urlunparse(
+            (parsed.scheme.lower(), parsed.netloc.lower(), path, parsed.params, query, "")
+        )
+
     def _scrape_website(self, base_url: str) -> str:
         """Scrape the homepage and subpages of a website."""
         pages_content = []
+        # Loop-invariant settings, bound once for the subpage loop below
+        fetch = self._fetch_and_parse
+        max_pages = self.max_pages
+        stop_early = not self.run_all_providers
+        target_chars = self.target_chars
+        base_dir = base_url + "/"
 
         # Always try the homepage first
-        homepage_content = self._fetch_and_parse(base_url)
+        homepage_content = fetch(base_url)
+        total_chars = len(homepage_content)
         if homepage_content:
             pages_content.append(f"[Homepage]\n{homepage_content}")
 
-        # Try subpages up to max_pages limit (homepage counts as 1)
-        for subpage in _SUBPAGES:
-            if len(pages_content) >= self.max_pages:
+        # Try subpages up to max_pages limit (homepage counts as 1). Each wave
+        # fetches as many subpages as are still needed in parallel; a later
+        # wave only runs if some of them came back empty. Once the target is
+        # met, the rest of a wave is fetched (and cached) but not used.
+        lead = self._lead_requests
+        candidates = [(subpage, urljoin(base_dir, subpage.lstrip("/"))) for subpage in _SUBPAGES]
+        while candidates and len(pages_content) < max_pages:
+            if stop_early and total_chars >= target_chars:
+                logger.debug("Enough website content gathered (%d chars)", total_chars)
                 break
-            if self._request_count >= 5:
-                logger.debug("Hit per-lead request limit (5)")
+            budget = _MAX_REQUESTS_PER_LEAD - lead.count
+            if budget <= 0:
+                logger.debug("Hit per-lead request limit (%d)", _MAX_REQUESTS_PER_LEAD)
                 break
 
-            page_url = urljoin(base_url + "/", subpage.lstrip("/"))
-            content = self._fetch_and_parse(page_url)
-            if content:
-                pages_content.append(f"[{subpage}]\n{content}")
+            wave_size = min(max_pages - len(pages_content), budget)
+            wave, candidates = candidates[:wave_size], candidates[wave_size:]
+            contents = self._fetch_pages([url for _, url in wave], lead)
+            for (subpage, _), content in zip(wave, contents):
+                if stop_early and total_chars >= target_chars:
+                    break
+                if content:
+                    total_chars += len(content)
+                    pages_content.append(f"[{subpage}]\n{content}")
 
         return "\n\n".join(pages_content)
 
+    def _fetch_pages(self, urls: List[str], lead: "_LeadRequests") -> List[str]:
+        """
+        Fetch several pages of one site concurrently, results in input order.
+
+        Workers share the lead's request accounting, so the per-lead budget
+        and the spacing between request starts still apply.
+        """
+        fetch = self._fetch_and_parse
+        if len(urls) == 1:
+            return [fetch(urls[0])]
+
+        def _fetch_for_lead(url: str) -> str:
+            self._local.lead = lead
+            return fetch(url)
+
+        with ThreadPoolExecutor(max_workers=len(urls)) as executor:
+            return list(executor.map(_fetch_for_lead, urls))
+
     def _fetch_and_parse(self, url: str) -> str:
         """Fetch a single URL and extract clean text. Returns empty string on failure."""
+        cache_key = self._canonical_url(url)
+
         # Check cache first
-        if url in self._cache:
+        cached = self._cache.get(cache_key)
+        if cached is not None:
             logger.debug("Cache hit: %s", url)
-            return self._cache[url]
+            return cached
+
+        try:
+            content = self._download_text(url)
+        except _RECOVERABLE as e:
+            logger.warning("Failed to fetch %s: %s", url, self._describe_http_error(e))
+            # Negative-cache the failure so broken URLs aren't retried until the TTL
+            content = ""
+        self._cache[cache_key] = content
+        return content
 
+    def _download_text(self, url: str) -> str:
+        """
+        Fetch and parse one uncached page. Errors in _RECOVERABLE propagate.
+
+        Returns an empty string when robots.txt disallows the URL.
+        """
         # Check robots.txt
         if not self._is_allowed(url):
             logger.info("Blocked by robots.txt: %s", url)
-            self._cache[url] = ""
             return ""
 
-        # Rate limiting
-        if self._request_count > 0:
-            time.sleep(self.delay)
+        # Rate limiting: request starts for one lead stay at least `delay` apart
+        wait = self._lead_requests.reserve(self.delay)
+        if wait > 0:
+            time.sleep(wait)
 
-        self._request_count += 1
+        # Stream the body into the parser so parsing overlaps the download
+        # and oversized pages are cut off at _MAX_PAGE_BYTES.
+        with self._client.stream("GET", url, follow_redirects=True) as response:
+            response.raise_for_status()
+            parser = self._new_html_parser(response.charset_encoding or "utf-8")
+            received = 0
+            for chunk in response.iter_bytes():
+                parser.feed(chunk)
+                received += len(chunk)
+                if received >= _MAX_PAGE_BYTES:
+                    logger.debug("Stopped reading %s after %d bytes", url, received)
+                    break
+        return self._text_from_parser(parser)
 
+    @staticmethod
+    def _new_html_parser(encoding: str) -> "lxml.html.HTMLParser":
+        """
+        Create a feed parser for one page. Comments are dropped at parse time.
+
+        Parsers hold per-document state, so each fetch gets its own.
+        """
+        # lxml validates the charset name here, so a bogus Content-Type charset
+        # raises now. codecs.lookup() can't vet it up front: lxml rejects some
+        # names Python accepts (cp437, mac-roman).
         try:
-            response = httpx.get(
-                url,
-                timeout=self.timeout,
-                follow_redirects=True,
-                headers={"User-Agent": "NotionCRMBot/1.0 (lead research)"},
-            )
-            response.raise_for_status()
-        except httpx.TimeoutException:
-            logger.warning("Timeout fetching %s", url)
-            self._cache[url] = ""
-            return ""
-        except httpx.HTTPStatusError as e:
-            logger.warning("HTTP %d fetching %s", e.response.status_code, url)
-            self._cache[url] = ""
-            return ""
-        except httpx.RequestError as e:
-            logger.warning("Request error fetching %s: %s", url, e)
-            self._cache[url] = ""
-            return ""
+            return lxml.html.HTMLParser(encoding=encoding, remove_comments=True)
+        except LookupError:
+            logger.debug("Unknown charset %r, decoding as utf-8", encoding)
+            return lxml.html.HTMLParser(encoding="utf-8", remove_comments=True)
 
-        content = self._extract_text(response.text)
-        self._cache[url] = content
-        return content
+    @classmethod
+    def _extract_text(cls, html: str, max_chars: int = _MAX_CONTENT_CHARS) -> str:
+        """Extract meaningful text from HTML, stripping nav, scripts, etc."""
+        # Parse bytes so pages with an XML encoding declaration are accepted.
+        parser = cls._new_html_parser("utf-8")
+        parser.feed(html.encode("utf-8"))
+        return cls._text_from_parser(parser, max_chars)
 
     @staticmethod
-    def _extract_text(html: str) -> str:
-        """Extract meaningful text from HTML, stripping nav, scripts, etc."""
-        soup = BeautifulSoup(html, "lxml")
+    def _text_from_parser(
+        parser: "lxml.html.HTMLParser", max_chars: int = _MAX_CONTENT_CHARS
+    ) -> str:
+        """
+        Finish a fed parser and return the page's meaningful text.
+
+        At most max_chars are returned. Research content is truncated to
+        _MAX_CONTENT_CHARS anyway, so lines past that are never collected.
+        """
+        try:
+            root = parser.close()
+        except etree.XMLSyntaxError:
+            # Nothing was fed (empty response body)
+            return ""
+        if root is None:
+            # Empty document, or nothing but comments/whitespace
+            return ""
 
-        # Remove unwanted tags
-        for tag in soup.find_all(_STRIP_TAGS):
-            tag.decompose()
+        # Remove unwanted tags; drop_tree keeps the text that follows each one
+        # but glues it onto the preceding text, so keep a line break between them
+        for element in list(root.iter(*_STRIP_TAGS)):
+            if element.tail:
+                element.tail = "\n" + element.tail
+            element.drop_tree()
 
-        # Get text, collapsing whitespace
-        text = soup.get_text(separator="\n")
-        lines = [line.strip() for line in text.splitlines()]
-        # Remove blank lines and very short lines (likely UI fragments)
-        lines = [line for line in lines if len(line) > 2]
+        # Join text nodes, keeping only stripped lines longer than 2 characters
+        text = "\n".join(_CONTENT_TEXT_XPATH(root))
+        lines = []
+        total_chars = 0
+        for match in _MEANINGFUL_LINE_RE.finditer(text):
+            line = match.group(1)
+            lines.append(line)
+            total_chars += len(line) + 1
+            if total_chars > max_chars:
+                return "\n".join(lines)[:max_chars]
         return "\n".join(lines)
 
     def _is_allowed(self, url: str) -> bool:
         """Check if the URL is allowed by robots.txt."""
-        parsed = urlparse(url)
-        robots_url = f"{parsed.scheme}://{parsed.netloc}/robots.txt"
-
-        if robots_url not in self._robot_parsers:
-            rp = urllib.robotparser.RobotFileParser()
-            rp.set_url(robots_url)
-            try:
-                rp.read()
-            except Exception:
-                # If we can't read robots.txt, assume allowed
-                logger.debug("Could not read robots.txt for %s, assuming allowed", parsed.netloc)
-                self._robot_parsers[robots_url] = None
-                return True
-            self._robot_parsers[robots_url] = rp
-
-        parser = self._robot_parsers[robots_url]
+        scheme, netloc, _ = _split(url)
+        origin = f"{scheme}://{netloc}"
+
+        parser = self._robot_parsers.get(origin, _MISSING)
+        if parser is _MISSING:
+            parser = self._fetch_robots(f"{origin}/robots.txt")
+            self._robot_parsers[origin] = parser
+
         if parser is None:
             return True
         return parser.can_fetch("NotionCRMBot", url)
 
+    def _fetch_robots(self, robots_url: str) -> Optional[urllib.robotparser.RobotFileParser]:
+        """
+        Fetch and parse robots.txt over the pooled client.
+
+        Status handling matches RobotFileParser.read(): 401/403 disallow
+        everything, other 4xx allow everything, 5xx disallow. Returns None
+        (treated as allowed) when robots.txt can't be fetched at all.
+        """
+        parser = urllib.robotparser.RobotFileParser(robots_url)
+        try:
+            response = self._client.get(robots_url, follow_redirects=True)
+        except (httpx.HTTPError, httpx.InvalidURL) as e:
+            # If we can't read robots.txt, assume allowed
+            logger.debug("Could not read %s (%s), assuming allowed", robots_url, e)
+            return None
+
+        status = response.status_code
+        if status in (401, 403) or status >= 500:
+            parser.disallow_all = True
+        elif status >= 400:
+            parser.allow_all = True
+        else:
+            parser.parse(response.text.splitlines())
+        return parser
+
     def _brave_search(self, query: str) -> tuple[str, List[str]]:
         """Run a Brave Search API query. Returns formatted results and source URLs."""
         if not self.brave_api_key:
             return "", []
 
         try:
-            response = httpx.get(
+            response = self._client.get(
                 "https://api.search.brave.com/res/v1/web/search",
                 params={"q": query, "count": 5},
                 headers={
                     "X-Subscription-Token": self.brave_api_key,
                     "Accept": "application/json",
                 },
-                timeout=self.timeout,
             )
             response.raise_for_status()
-        except (httpx.HTTPStatusError, httpx.RequestError, httpx.TimeoutException) as e:
-            logger.warning("Brave search failed for '%s': %s", query, e)
+        except _RECOVERABLE as e:
+            logger.warning("Brave search failed for '%s': %s", query, self._describe_http_error(e))
             return "", []
 
         data = response.json()
@@ -377,6 +674,15 @@ class WebResearchService:
 
         return "\n".join(lines), urls
 
+    @staticmethod
+    def _describe_http_error(error: Exception) -> str:
+        """Short log description of a recoverable HTTP failure."""
+        if isinstance(error, httpx.TimeoutException):
+            return "timeout"
+        if isinstance(error, httpx.HTTPStatusError):
+            return f"HTTP {error.response.status_code}"
+        return f"{type(error).__name__}: {error}"
+
     @staticmethod
     def _truncate(text: str) -> str:
         """Truncate text to stay within token budget."""
@@ -6,7 +6,9 @@ and optionally bootstraps missing output properties in the target database.
 """
 
 import os
+import re
 import getpass
+import shutil
 from pathlib import Path
 from typing import Dict, Optional
 
@@ -17,12 +19,41 @@ from services.notion_service import NotionService
 _REQUIRED_KEYS = ("NOTION_API_KEY", "NOTION_DATABASE_ID", "CLAUDE_API_KEY")
 _DEFAULT_MODEL = "claude-sonnet-4-5-20250929"
 
+# KEY=value lines as written by _write_env_file: unquoted values without
+# whitespace/quotes/comments, or double-quoted values without escapes.
+# Anything else (escapes, interpolation, export, multiline) goes to dotenv.
+_SIMPLE_ENV_LINE_RE = re.compile(
+    r'^([A-Za-z_][A-Za-z0-9_]*)=(?:"([^"\\$]*)"|([^\s"\'\\#$]*))$'
+)
+
 
 def _read_env_file(path: Path) -> Dict[str, str]:
     if not path.exists():
         return {}
-    values = dotenv_values(path)
-    return {k: str(v) for k, v in values.items() if k and v is not None}
+    values = _read_env_simple(path)
+    if values is None:
+        values = {k: v for k, v in dotenv_values(path).items() if v is not None}
+    return {k: str(v) for k, v in values.items() if k}
+
+
+def _read_env_simple(path: Path) -> Optional[Dict[str, str]]:
+    """
+    Parse a plain KEY=value .env file in a single pass.
+
+    Returns None if any line needs full dotenv parsing.
+    """
+    values: Dict[str, str] = {}
+    with path.open() as handle:
+        for raw_line in handle:
+            line = raw_line.strip()
+            if not line or line.startswith("#"):
+                continue
+            match = _SIMPLE_ENV_LINE_RE.match(line)
+            if not match:
+                return None
+            key, quoted, bare = match.groups()
+            values[key] = quoted if quoted is not None else bare
+    return values
 
 
 def _format_env_value(value: str) -> str:
@@ -35,13 +66,19 @@ def _format_env_value(value: str) -> str:
 def _write_env_file(path: Path, values: Dict[str, str]) -> None:
     ordered_keys = list(_REQUIRED_KEYS) + ["CLAUDE_MODEL"]
     extra_keys = sorted(k for k in values if k not in ordered_keys)
-    lines = []
-    for key in ordered_keys + extra_keys:
-        value = values.get(key)
-        if value is None:
-            continue
-        lines.append(f"{key}={_format_env_value(value)}")
-    path.write_text("\n".join(lines) + "\n")
+    body = "".join(
+        f"{key}={_format_env_value(values[key])}\n"
+        for key in ordered_keys + extra_keys
+        if values.get(key) is not None
+    )
+
+    # Swap the new file in whole so an interrupted write can't truncate .env;
+    # keep the existing file's permissions since it holds secrets.
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(body)
+    if path.exists():
+        shutil.copymode(path, tmp_path)
+    os.replace(tmp_path, path)
 
 
 def _prompt_value(name: str, default: Optional[str] = None, secret: bool = False) -> str:
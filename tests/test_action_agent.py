@@ -55,3 +55,11 @@ def test_invalid_action_and_confidence_are_normalized():
 
     assert result["next_action"] == "enrich_data"
     assert result["action_confidence"] == "medium"
+
+
+def test_empty_llm_object_defaults_to_enrich_data():
+    agent = ActionAgent(_StubClaude("{}"))
+    result = agent.run({"company_name": "Acme", "priority_tier": "medium"})
+
+    assert result["next_action"] == "enrich_data"
+    assert result["action_confidence"] == "low"
@@ -0,0 +1,52 @@
+from agents.icp_agent import ICPAgent
+
+
+class _StubClaude:
+    def __init__(self, response: str):
+        self.response = response
+
+    def generate_structured(self, prompt: str, system_prompt: str = "") -> str:
+        return self.response
+
+    def generate(self, prompt: str, system_prompt: str = "") -> str:
+        return self.response
+
+
+def test_parses_json_and_clamps_scores():
+    response = (
+        '{"icp_score": 140, "dimension_scores": {"company_size_stage": 25},'
+        ' "confidence_score": 65, "icp_reasoning": "Good fit.", "extra": true}'
+    )
+    result = ICPAgent(_StubClaude(response)).run({"company_name": "Acme"})
+
+    assert result["icp_score"] == 100
+    assert result["confidence_score"] == 65
+    assert result["icp_reasoning"] == "Good fit."
+    assert result["data_gaps"] == ""
+
+
+def test_parses_fenced_json_and_derives_score_from_dimensions():
+    response = (
+        "Here is the score:\n```json\n"
+        '{"dimension_scores": {"company_size_stage": 12, "market_industry_fit": "18"},'
+        ' "confidence_score": 40, "data_gaps": ["headcount", "budget"]}\n```'
+    )
+    result = ICPAgent(_StubClaude(response)).run({"company_name": "Acme"})
+
+    assert result["icp_score"] == 30
+    assert result["data_gaps"] == "headcount; budget"
+
+
+def test_invalid_response_returns_unscored_result():
+    result = ICPAgent(_StubClaude("not-json")).run({"company_name": "Acme"})
+
+    assert result["icp_score"] == -1
+    assert result["confidence_score"] == 0
+
+
+def test_list_reasoning_is_joined_into_text():
+    response = '{"icp_score": 70, "icp_reasoning": ["Strong fit.", "Recent funding."]}'
+    result = ICPAgent(_StubClaude(response)).run({"company_name": "Acme"})
+
+    assert result["icp_score"] == 70
+    assert result["icp_reasoning"] == "Strong fit. Recent funding."
@@ -1,4 +1,8 @@
-from services.notion_service import NotionService
+import httpx
+from notion_client import APIResponseError
+
+from services import notion_service
+from services.notion_service import NotionService, _RequestPacer, _retry
 from config import Config
 
 
@@ -9,8 +13,16 @@ def test_maps_canonical_output_keys_to_configured_names(monkeypatch):
     monkeypatch.setattr(Config, "NOTION_PROP_RESEARCH_PROVIDERS", "Research Providers")
     monkeypatch.setattr(Config, "NOTION_PROP_SIGNAL_TYPE", "Signal Type")
     service = NotionService(api_key="secret_test", database_id="dbid")
+    service._database_properties_cache = {
+        "ICP Score": {"type": "number"},
+        "Next Action": {"type": "select"},
+        "Research Confidence": {"type": "select"},
+        "Research Providers": {"type": "rich_text"},
+        "Signal Type": {"type": "select"},
+        "custom": {"type": "rich_text"},
+    }
 
-    mapped = service._map_output_property_names(
+    mapped = service._prepare_update_properties(
         {
             "icp_score": 91,
             "next_action": "outreach_now",
@@ -21,12 +33,14 @@ def test_maps_canonical_output_keys_to_configured_names(monkeypatch):
         }
     )
 
-    assert mapped["ICP Score"] == 91
-    assert mapped["Next Action"] == "outreach_now"
-    assert mapped["Research Confidence"] == "high"
-    assert mapped["Research Providers"] == "website:success"
-    assert mapped["Signal Type"] == "funding"
-    assert mapped["custom"] == "x"
+    assert mapped["ICP Score"] == {"number": 91}
+    assert mapped["Next Action"] == {"select": {"name": "outreach_now"}}
+    assert mapped["Research Confidence"] == {"select": {"name": "high"}}
+    assert mapped["Research Providers"] == {
+        "rich_text": [{"text": {"content": "website:success"}}]
+    }
+    assert mapped["Signal Type"] == {"select": {"name": "funding"}}
+    assert mapped["custom"] == {"rich_text": [{"text": {"content": "x"}}]}
 
 
 def test_formats_by_schema_type_and_skips_unknown_properties():
@@ -38,7 +52,7 @@ def test_formats_by_schema_type_and_skips_unknown_properties():
         "stale_flag": {"type": "checkbox"},
     }
 
-    notion_props = service._format_properties_for_notion(
+    notion_props = service._prepare_update_properties(
         {
             "icp_score": 88,
             "priority_tier": "high",
@@ -65,6 +79,43 @@ def test_prepare_update_properties_maps_then_formats(monkeypatch):
     assert notion_props == {"ICP Score": {"number": 77}}
 
 
+def test_prepare_update_properties_skips_bad_values_and_keeps_input_order(monkeypatch):
+    monkeypatch.setattr(Config, "NOTION_PROP_ICP_SCORE", "ICP Score")
+    monkeypatch.setattr(Config, "NOTION_PROP_PRIORITY_TIER", "Priority")
+    service = NotionService(api_key="secret_test", database_id="dbid")
+    service._database_properties_cache = {
+        "ICP Score": {"type": "number"},
+        "Priority": {"type": "select"},
+        "Notes": {"type": "rich_text"},
+    }
+
+    notion_props = service._prepare_update_properties(
+        {
+            "Notes": "Context",
+            "icp_score": "not a number",
+            "priority_tier": "high",
+            "signal_type": "funding",
+            "stale_flag": None,
+        }
+    )
+
+    assert list(notion_props) == ["Notes", "Priority"]
+    assert notion_props["Priority"] == {"select": {"name": "high"}}
+
+
+def test_prepare_update_properties_logs_unknown_columns_at_debug(caplog):
+    service = NotionService(api_key="secret_test", database_id="dbid")
+    service._database_properties_cache = {"icp_score": {"type": "number"}}
+
+    with caplog.at_level("DEBUG", logger="services.notion_service"):
+        notion_props = service._prepare_update_properties(
+            {"icp_score": 70, "days_since_contact": 3}
+        )
+
+    assert notion_props == {"icp_score": {"number": 70}}
+    assert "Skipping unknown Notion property: days_since_contact" in caplog.text
+
+
 def test_extract_lead_includes_existing_results_and_last_edited_time():
     service = NotionService(api_key="secret_test", database_id="dbid")
     page = {
@@ -140,6 +191,29 @@ def test_bootstrap_output_properties_creates_only_missing(monkeypatch):
     assert next_action_col in created
 
 
+def test_bootstrap_output_properties_uses_update_response_schema(monkeypatch):
+    service = NotionService(api_key="secret_test", database_id="dbid")
+    service._database_properties_cache = {}
+    full_schema = {"Name": {"type": "title"}, Config.NOTION_PROP_ICP_SCORE: {"type": "number"}}
+    calls = {"update": 0}
+
+    def _fake_update(_props):
+        calls["update"] += 1
+        return {"properties": full_schema}
+
+    def _fail_retrieve():
+        raise AssertionError("schema should come from the update response")
+
+    monkeypatch.setattr(service, "_update_database_properties", _fake_update)
+    monkeypatch.setattr(service, "_retrieve_database", _fail_retrieve)
+
+    created = service.bootstrap_output_properties()
+
+    assert calls["update"] == 1
+    assert Config.NOTION_PROP_ICP_SCORE in created
+    assert service._database_properties_cache == full_schema
+
+
 def test_bootstrap_output_properties_noop_when_all_present(monkeypatch):
     service = NotionService(api_key="secret_test", database_id="dbid")
     full_schema = service._output_property_schema()
@@ -158,3 +232,185 @@ def test_bootstrap_output_properties_noop_when_all_present(monkeypatch):
 
     assert created == []
     assert not called["updated"]
+
+
+def test_update_leads_batch_returns_flags_in_input_order(monkeypatch):
+    service = NotionService(api_key="secret_test", database_id="dbid")
+    service._database_properties_cache = {"icp_score": {"type": "number"}}
+    written = []
+
+    def _fake_update_page(page_id, notion_properties):
+        if page_id == "page-2":
+            raise RuntimeError("Notion API call failed")
+        written.append((page_id, notion_properties))
+
+    monkeypatch.setattr(service, "_update_page", _fake_update_page)
+
+    outcomes = service.update_leads_batch(
+        [
+            ("page-1", {"icp_score": 70}),
+            ("page-2", {"icp_score": 80}),
+            ("page-3", {"unknown": "x"}),
+        ]
+    )
+
+    assert outcomes == [True, False, True]
+    assert written == [("page-1", {"icp_score": {"number": 70}})]
+
+
+def _fake_clock(monkeypatch):
+    now = [1000.0]
+    sleeps = []
+
+    def _sleep(seconds):
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    monkeypatch.setattr(notion_service.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(notion_service.time, "sleep", _sleep)
+    return sleeps
+
+
+def test_request_pacer_spaces_starts_to_budget(monkeypatch):
+    sleeps = _fake_clock(monkeypatch)
+    pacer = _RequestPacer(requests_per_second=2)
+
+    for _ in range(3):
+        pacer.wait()
+
+    assert sleeps == [0.5, 0.5]
+
+
+def test_update_leads_batch_paces_writes_per_second(monkeypatch):
+    sleeps = _fake_clock(monkeypatch)
+    monkeypatch.setattr(Config, "NOTION_WRITE_CONCURRENCY", 1)
+    monkeypatch.setattr(Config, "NOTION_WRITES_PER_SECOND", 4)
+    service = NotionService(api_key="secret_test", database_id="dbid")
+    service._database_properties_cache = {"icp_score": {"type": "number"}}
+    monkeypatch.setattr(service, "_update_page", lambda page_id, props: None)
+
+    outcomes = service.update_leads_batch(
+        [(f"page-{i}", {"icp_score": i}) for i in range(4)]
+    )
+
+    assert outcomes == [True] * 4
+    assert sleeps == [0.25, 0.25, 0.25]
+
+
+def _api_error(status, headers=None):
+    return APIResponseError(
+        code="rate_limited",
+        status=status,
+        message="slow down",
+        headers=httpx.Headers(headers or {}),
+        raw_body_text="",
+    )
+
+
+def test_retry_waits_for_retry_after_on_429(monkeypatch):
+    sleeps = _fake_clock(monkeypatch)
+    errors = [_api_error(429, {"Retry-After": "7"})]
+
+    @_retry
+    def _call():
+        if errors:
+            raise errors.pop()
+        return "ok"
+
+    assert _call() == "ok"
+    assert sleeps == [7.0]
+
+
+def test_retry_caps_huge_retry_after(monkeypatch):
+    sleeps = _fake_clock(monkeypatch)
+    errors = [_api_error(429, {"Retry-After": "86400"})]
+
+    @_retry
+    def _call():
+        if errors:
+            raise errors.pop()
+        return "ok"
+
+    assert _call() == "ok"
+    assert sleeps == [notion_service._MAX_RETRY_AFTER]
+
+
+def test_retry_backs_off_without_retry_after(monkeypatch):
+    sleeps = _fake_clock(monkeypatch)
+    errors = [_api_error(503), _api_error(429, {"Retry-After": "soon"})]
+
+    @_retry
+    def _call():
+        if errors:
+            raise errors.pop()
+        return "ok"
+
+    assert _call() == "ok"
+    assert sleeps == [1.0, 2.0]
+
+
+def test_select_values_from_different_pages_share_one_string():
+    service = NotionService(api_key="secret_test", database_id="dbid")
+
+    def _page(page_id):
+        # Build the option name at runtime, as JSON decoding would.
+        status = "".join(["Quali", "fied"])
+        return {
+            "id": page_id,
+            "properties": {
+                Config.NOTION_PROP_STATUS: {"type": "select", "select": {"name": status}},
+            },
+        }
+
+    first = service._extract_lead_from_page(_page("page-1"))
+    second = service._extract_lead_from_page(_page("page-2"))
+
+    assert first["status"] == "Qualified"
+    assert first["status"] is second["status"]
+
+
+def test_database_schema_is_shared_across_instances_until_ttl(monkeypatch):
+    monkeypatch.setattr(notion_service, "_SCHEMA_CACHE", {})
+    calls = {"retrieve": 0}
+
+    def _make_service():
+        service = NotionService(api_key="secret_test", database_id="dbid")
+
+        def _fake_retrieve():
+            calls["retrieve"] += 1
+            return {"properties": {"icp_score": {"type": "number"}}}
+
+        monkeypatch.setattr(service, "_retrieve_database", _fake_retrieve)
+        return service
+
+    assert _make_service()._get_database_properties() == {"icp_score": {"type": "number"}}
+    assert _make_service()._get_database_properties() == {"icp_score": {"type": "number"}}
+    assert calls["retrieve"] == 1
+
+    monkeypatch.setattr(notion_service, "_SCHEMA_CACHE_TTL", -1.0)
+    notion_service._SCHEMA_CACHE.clear()
+    _make_service()._get_database_properties()
+    _make_service()._get_database_properties()
+    assert calls["retrieve"] == 3
+
+
+def test_fetch_leads_pages_lazily(monkeypatch):
+    service = NotionService(api_key="secret_test", database_id="dbid")
+    pages = {
+        None: {"results": [{"id": "p1"}], "has_more": True, "next_cursor": "c2"},
+        "c2": {"results": [{"id": "p2"}], "has_more": False},
+    }
+    queried = []
+
+    def _fake_query(_filter, start_cursor):
+        queried.append(start_cursor)
+        return pages[start_cursor]
+
+    monkeypatch.setattr(service, "_query_database", _fake_query)
+    monkeypatch.setattr(service, "_extract_lead_from_page", lambda page: {"page_id": page["id"]})
+
+    leads = service.fetch_leads()
+    assert next(leads) == {"page_id": "p1"}
+    assert queried == [None]
+    assert [lead["page_id"] for lead in leads] == ["p2"]
+    assert queried == [None, "c2"]
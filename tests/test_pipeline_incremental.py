@@ -1,4 +1,5 @@
 import json
+import time
 
 import pipeline as pipeline_module
 
@@ -18,6 +19,9 @@ class _StubNotionService:
         self.updated.append((page_id, properties))
         return True
 
+    def update_leads_batch(self, updates):
+        return [self.update_lead(page_id, properties) for page_id, properties in updates]
+
 
 class _StubClaudeService:
     pass
@@ -196,3 +200,109 @@ def test_full_refresh_processes_all_leads_even_if_unchanged(tmp_path, monkeypatc
     assert result.succeeded == 1
     assert result.skipped == 0
     assert [page_id for page_id, _ in notion_stub.updated] == ["unchanged_scored"]
+
+
+def test_failed_notion_write_counts_as_failure_and_keeps_state(tmp_path, monkeypatch):
+    state_path = tmp_path / "pipeline_state.json"
+    monkeypatch.setattr(pipeline_module.Config, "PIPELINE_STATE_FILE", str(state_path))
+
+    leads = [
+        _lead("ok", "2026-02-21T00:00:00+00:00", {}),
+        _lead("write_fails", "2026-02-21T00:00:00+00:00", {}),
+    ]
+    notion_stub = _StubNotionService(leads)
+    notion_stub.update_leads_batch = lambda updates: [
+        page_id != "write_fails" for page_id, _ in updates
+    ]
+    _patch_pipeline_dependencies(monkeypatch, notion_stub)
+
+    result = pipeline_module.run_pipeline()
+
+    assert result.succeeded == 1
+    assert result.failed == 1
+    assert [summary.company for summary in result.lead_summaries] == ["ok"]
+    assert not state_path.exists()
+
+
+def test_state_file_is_replaced_atomically(tmp_path, monkeypatch):
+    state_path = tmp_path / "state" / "pipeline_state.json"
+    monkeypatch.setattr(pipeline_module.Config, "PIPELINE_STATE_FILE", str(state_path))
+    timestamp = pipeline_module.datetime(2026, 3, 1, tzinfo=pipeline_module.timezone.utc)
+
+    pipeline_module._save_last_successful_run(timestamp)
+
+    assert pipeline_module._load_last_successful_run() == timestamp
+    assert [p.name for p in state_path.parent.iterdir()] == ["pipeline_state.json"]
+
+
+def test_parallel_processing_keeps_input_order(tmp_path, monkeypatch):
+    state_path = tmp_path / "pipeline_state.json"
+    monkeypatch.setattr(pipeline_module.Config, "PIPELINE_STATE_FILE", str(state_path))
+    monkeypatch.setattr(pipeline_module.Config, "PIPELINE_CONCURRENCY", 3)
+
+    class _SlowFirstICPAgent(_StubICPAgent):
+        def run(self, lead):
+            # Finish leads out of order: the first lead is the slowest.
+            time.sleep({"a": 0.15, "b": 0.05}.get(lead["page_id"], 0))
+            if lead["page_id"] == "boom":
+                raise RuntimeError("agent failed")
+            return super().run(lead)
+
+    leads = [_lead(page_id, "2026-02-21T00:00:00+00:00", {}) for page_id in ("a", "b", "boom", "c")]
+    notion_stub = _StubNotionService(leads)
+    _patch_pipeline_dependencies(monkeypatch, notion_stub)
+    monkeypatch.setattr(pipeline_module, "ICPAgent", _SlowFirstICPAgent)
+
+    result = pipeline_module.run_pipeline()
+
+    assert result.succeeded == 3
+    assert result.failed == 1
+    assert result.errors == ["boom: agent failed"]
+    assert [page_id for page_id, _ in notion_stub.updated] == ["a", "b", "c"]
+
+
+def test_agents_are_built_once_per_run(tmp_path, monkeypatch):
+    state_path = tmp_path / "pipeline_state.json"
+    monkeypatch.setattr(pipeline_module.Config, "PIPELINE_STATE_FILE", str(state_path))
+    built = []
+
+    class _CountingICPAgent(_StubICPAgent):
+        def __init__(self, claude):
+            built.append(self)
+            super().__init__(claude)
+
+    leads = [_lead(page_id, "2026-02-21T00:00:00+00:00", {}) for page_id in ("a", "b", "c")]
+    notion_stub = _StubNotionService(leads)
+    _patch_pipeline_dependencies(monkeypatch, notion_stub)
+    monkeypatch.setattr(pipeline_module, "ICPAgent", _CountingICPAgent)
+
+    result = pipeline_module.run_pipeline()
+
+    assert result.succeeded == 3
+    assert len(built) == 1
+
+
+def test_limit_stops_pulling_leads_from_stream(tmp_path, monkeypatch):
+    state_path = tmp_path / "pipeline_state.json"
+    monkeypatch.setattr(pipeline_module.Config, "PIPELINE_STATE_FILE", str(state_path))
+    pulled = []
+
+    def _stream():
+        for page_id in ("scored", "a", "b", "c"):
+            pulled.append(page_id)
+            existing = (
+                {"icp_score": 90, "priority_tier": "high", "next_action": "outreach_now"}
+                if page_id == "scored"
+                else {}
+            )
+            yield _lead(page_id, "2026-02-21T00:00:00+00:00", existing)
+
+    notion_stub = _StubNotionService([])
+    notion_stub.fetch_leads = _stream
+    _patch_pipeline_dependencies(monkeypatch, notion_stub)
+
+    result = pipeline_module.run_pipeline(limit=2)
+
+    assert pulled == ["scored", "a", "b"]
+    assert result.skipped == 1
+    assert [page_id for page_id, _ in notion_stub.updated] == ["a", "b"]
@@ -65,3 +65,12 @@ def test_non_high_signal_does_not_boost():
 
     assert result["priority_tier"] == "medium"
     assert "Boosted from" not in result["priority_reasoning"]
+
+
+def test_empty_llm_object_takes_parse_failure_path():
+    agent = PriorityAgent(_StubClaude("{}"))
+
+    tier, reasoning = agent._llm_priority({"company_name": "Acme"}, 55, 10)
+
+    assert tier == "medium"
+    assert reasoning.startswith("Could not parse")
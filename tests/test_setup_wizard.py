@@ -73,3 +73,35 @@ def test_setup_wizard_returns_error_when_notion_validation_fails(tmp_path, monke
 
     assert exit_code == 1
     assert Path(env_path).exists()
+
+
+def test_env_file_round_trip_uses_fast_path_and_dotenv_fallback(tmp_path):
+    env_path = tmp_path / ".env"
+    values = {
+        "NOTION_API_KEY": "secret_round_trip",
+        "CLAUDE_MODEL": "claude-sonnet-4-5-20250929",
+        "ICP_CRITERIA": "B2B SaaS # mid-market",
+    }
+    setup_wizard._write_env_file(env_path, values)
+
+    assert setup_wizard._read_env_simple(env_path) == values
+    assert setup_wizard._read_env_file(env_path) == values
+
+    env_path.write_text('NOTION_API_KEY=secret_x\nNOTES="say \\"hi\\""\n')
+    assert setup_wizard._read_env_simple(env_path) is None
+    assert setup_wizard._read_env_file(env_path) == {
+        "NOTION_API_KEY": "secret_x",
+        "NOTES": 'say "hi"',
+    }
+
+
+def test_write_env_file_replaces_atomically_and_keeps_permissions(tmp_path):
+    env_path = tmp_path / ".env"
+    env_path.write_text("OLD=1\n")
+    env_path.chmod(0o600)
+
+    setup_wizard._write_env_file(env_path, {"NOTION_API_KEY": "secret_new"})
+
+    assert env_path.read_text() == "NOTION_API_KEY=secret_new\n"
+    assert env_path.stat().st_mode & 0o777 == 0o600
+    assert [p.name for p in tmp_path.iterdir()] == [".env"]
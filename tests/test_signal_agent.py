@@ -48,3 +48,17 @@ def test_returns_none_when_no_signals_found():
     assert result["signal_type"] == "none"
     assert result["signal_strength"] == "none"
     assert result["signal_date"] == "2026-02-03"
+
+
+def test_first_strongest_rule_wins_when_several_match():
+    agent = SignalAgent()
+    result = agent.run(
+        {
+            "company_name": "Acme",
+            "notes": "Hiring across GTM after closing a Series B; also budget approved.",
+            "research_brief": "",
+        }
+    )
+
+    assert result["signal_type"] == "buying_intent"
+    assert "budget approved" in result["signal_reasoning"]
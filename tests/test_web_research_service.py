@@ -4,10 +4,29 @@ Tests for WebResearchService.
 All tests use mocks — no live network calls.
 """
 
+import threading
+
 import pytest
 from unittest.mock import patch, MagicMock
 
-from services.web_research_service import WebResearchService, WebResearchResult
+from services import web_research_service
+from services.web_research_service import (
+    WebResearchService,
+    WebResearchResult,
+    _LeadRequests,
+    _LRU2Cache,
+)
+
+
+def _page_stream(html, status_code=200):
+    """Mock for the context manager returned by httpx.Client.stream()."""
+    response = MagicMock()
+    response.status_code = status_code
+    response.charset_encoding = "utf-8"
+    response.iter_bytes.return_value = [html.encode("utf-8")]
+    response.raise_for_status.return_value = None
+    response.__enter__.return_value = response
+    return response
 
 
 # --- URL Normalization ---
@@ -40,6 +59,29 @@ class TestNormalizeUrl:
         assert WebResearchService._normalize_url("example.com/about") == "https://example.com/about"
 
 
+class TestCanonicalUrl:
+    """Test cache key canonicalization."""
+
+    def test_equivalent_urls_share_a_key(self):
+        variants = [
+            "https://acme.com/about",
+            "https://acme.com/about/",
+            "https://ACME.com//about",
+            "https://acme.com/about?utm_source=x&fbclid=abc",
+            "https://acme.com/about#top",
+        ]
+        keys = {WebResearchService._canonical_url(url) for url in variants}
+        assert keys == {"https://acme.com/about"}
+
+    def test_root_keeps_single_slash(self):
+        assert WebResearchService._canonical_url("https://acme.com") == "https://acme.com/"
+        assert WebResearchService._canonical_url("https://acme.com/") == "https://acme.com/"
+
+    def test_query_is_sorted_and_content_params_kept(self):
+        key = WebResearchService._canonical_url("https://acme.com/p?b=2&a=1&ref=hn")
+        assert key == "https://acme.com/p?a=1&b=2"
+
+
 # --- Content Extraction ---
 
 class TestExtractText:
@@ -82,90 +124,192 @@ class TestExtractText:
         assert "OK" not in text
         assert "longer meaningful line" in text
 
+    def test_strips_padding_before_length_check(self):
+        html = "<html><body><p>   OK   </p><p>\n\t  padded meaningful line  \n</p></body></html>"
+        text = WebResearchService._extract_text(html)
+        assert text == "padded meaningful line"
+
+    def test_stops_collecting_text_at_max_chars(self):
+        html = "<html><body>" + "<p>A meaningful sentence of text.</p>" * 2000 + "</body></html>"
+        text = WebResearchService._extract_text(html)
+        assert len(text) == 12_000
+        assert WebResearchService._truncate(text) == text
+        assert WebResearchService._extract_text(html, max_chars=40) == (
+            "A meaningful sentence of text.\nA meaning"
+        )
+
+    def test_ignores_comments_and_empty_documents(self):
+        html = "<html><body><p>Visible paragraph</p><!-- internal note --></body></html>"
+        assert WebResearchService._extract_text(html) == "Visible paragraph"
+        assert WebResearchService._extract_text("") == ""
+        assert WebResearchService._extract_text("<!-- only a comment -->") == ""
+
+    def test_text_around_stripped_tags_stays_separate(self):
+        html = "<html><body><p>Call us now<script>x</script>for a demo today</p></body></html>"
+        assert WebResearchService._extract_text(html) == "Call us now\nfor a demo today"
+
+        html = "<html><body><div>Intro text<form><input></form>More text here</div></body></html>"
+        assert WebResearchService._extract_text(html) == "Intro text\nMore text here"
+
 
 # --- Robots.txt Compliance ---
 
+def _robots_response(text="", status_code=200):
+    response = MagicMock()
+    response.status_code = status_code
+    response.text = text
+    return response
+
+
 class TestRobotsTxt:
     """Test robots.txt checking."""
 
-    @patch("services.web_research_service.urllib.robotparser.RobotFileParser")
-    def test_respects_disallow(self, mock_rp_class):
-        mock_rp = MagicMock()
-        mock_rp.can_fetch.return_value = False
-        mock_rp_class.return_value = mock_rp
+    @patch("services.web_research_service.httpx.Client.get")
+    def test_respects_disallow(self, mock_get):
+        mock_get.return_value = _robots_response("User-agent: *\nDisallow: /secret\n")
 
         service = WebResearchService(timeout=5, delay=0)
         allowed = service._is_allowed("https://example.com/secret")
 
         assert not allowed
-        mock_rp.can_fetch.assert_called_once_with("NotionCRMBot", "https://example.com/secret")
+        assert mock_get.call_args.args[0] == "https://example.com/robots.txt"
 
-    @patch("services.web_research_service.urllib.robotparser.RobotFileParser")
-    def test_allows_when_permitted(self, mock_rp_class):
-        mock_rp = MagicMock()
-        mock_rp.can_fetch.return_value = True
-        mock_rp_class.return_value = mock_rp
+    @patch("services.web_research_service.httpx.Client.get")
+    def test_reuses_parser_for_same_origin(self, mock_get):
+        mock_get.return_value = _robots_response("User-agent: *\nDisallow: /\n")
+
+        service = WebResearchService(timeout=5, delay=0)
+        assert not service._is_allowed("https://example.com/secret")
+        assert not service._is_allowed("https://example.com/private/page")
+        service._is_allowed("https://other.com/")
+
+        assert mock_get.call_count == 2
+
+    @patch("services.web_research_service.httpx.Client.get")
+    def test_allows_when_permitted(self, mock_get):
+        mock_get.return_value = _robots_response("User-agent: *\nDisallow: /secret\n")
 
         service = WebResearchService(timeout=5, delay=0)
         allowed = service._is_allowed("https://example.com/public")
 
         assert allowed
 
-    @patch("services.web_research_service.urllib.robotparser.RobotFileParser")
-    def test_allows_when_robots_txt_unreadable(self, mock_rp_class):
-        mock_rp = MagicMock()
-        mock_rp.read.side_effect = Exception("Connection refused")
-        mock_rp_class.return_value = mock_rp
+    @patch("services.web_research_service.httpx.Client.get")
+    def test_allows_when_robots_txt_unreadable(self, mock_get):
+        import httpx
+        mock_get.side_effect = httpx.ConnectError("Connection refused")
 
         service = WebResearchService(timeout=5, delay=0)
         allowed = service._is_allowed("https://example.com/page")
 
         assert allowed  # Default to allowed when robots.txt is unreachable
 
+    def test_allows_when_origin_is_malformed(self):
+        # httpx rejects the URL with InvalidURL before any connection is made
+        service = WebResearchService(timeout=5, delay=0)
+
+        assert service._is_allowed("https://:bad:port/page")
+
+    @pytest.mark.parametrize(
+        ("status_code", "expected"),
+        [(404, True), (401, False), (403, False), (503, False)],
+    )
+    @patch("services.web_research_service.httpx.Client.get")
+    def test_status_codes_follow_robotparser_rules(self, mock_get, status_code, expected):
+        mock_get.return_value = _robots_response(status_code=status_code)
+
+        service = WebResearchService(timeout=5, delay=0)
+
+        assert service._is_allowed("https://example.com/page") is expected
+
 
 # --- Graceful Failure ---
 
 class TestGracefulFailure:
     """Test that errors don't crash the service."""
 
-    @patch("services.web_research_service.httpx.get")
+    @patch("services.web_research_service.httpx.Client.stream")
     @patch.object(WebResearchService, "_is_allowed", return_value=True)
-    def test_timeout_returns_empty(self, _mock_allowed, mock_get):
+    def test_unknown_charset_falls_back_to_utf8(self, _mock_allowed, mock_stream):
+        response = _page_stream("<html><body><p>Caf\u00e9 content here</p></body></html>")
+        response.charset_encoding = "x-not-a-charset"
+        mock_stream.return_value = response
+
+        service = WebResearchService(timeout=5, delay=0)
+
+        assert service._fetch_and_parse("https://example.com") == "Caf\u00e9 content here"
+
+    @patch("services.web_research_service.httpx.Client.stream")
+    @patch.object(WebResearchService, "_is_allowed", return_value=True)
+    def test_timeout_returns_empty(self, _mock_allowed, mock_stream):
         import httpx
-        mock_get.side_effect = httpx.TimeoutException("Timed out")
+        mock_stream.side_effect = httpx.TimeoutException("Timed out")
 
         service = WebResearchService(timeout=5, delay=0)
         result = service._fetch_and_parse("https://example.com")
 
         assert result == ""
 
-    @patch("services.web_research_service.httpx.get")
+    @patch("services.web_research_service.httpx.Client.stream")
     @patch.object(WebResearchService, "_is_allowed", return_value=True)
-    def test_connection_error_returns_empty(self, _mock_allowed, mock_get):
+    def test_connection_error_returns_empty(self, _mock_allowed, mock_stream):
         import httpx
-        mock_get.side_effect = httpx.ConnectError("Connection refused")
+        mock_stream.side_effect = httpx.ConnectError("Connection refused")
 
         service = WebResearchService(timeout=5, delay=0)
         result = service._fetch_and_parse("https://example.com")
 
         assert result == ""
 
-    @patch("services.web_research_service.httpx.get")
+    @patch("services.web_research_service.httpx.Client.stream")
     @patch.object(WebResearchService, "_is_allowed", return_value=True)
-    def test_http_error_returns_empty(self, _mock_allowed, mock_get):
+    def test_http_error_returns_empty(self, _mock_allowed, mock_stream):
         import httpx
-        mock_response = MagicMock()
-        mock_response.status_code = 404
+        mock_response = _page_stream("", status_code=404)
         mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
             "Not Found", request=MagicMock(), response=mock_response
         )
-        mock_get.return_value = mock_response
+        mock_stream.return_value = mock_response
 
         service = WebResearchService(timeout=5, delay=0)
         result = service._fetch_and_parse("https://example.com")
 
         assert result == ""
 
+    @patch("services.web_research_service.httpx.Client.stream")
+    @patch.object(WebResearchService, "_is_allowed", return_value=True)
+    def test_failed_fetch_is_negatively_cached(self, _mock_allowed, mock_stream):
+        import httpx
+        mock_stream.side_effect = httpx.TimeoutException("Timed out")
+
+        service = WebResearchService(timeout=5, delay=0)
+        assert service._fetch_and_parse("https://example.com/slow") == ""
+        assert service._fetch_and_parse("https://example.com/slow") == ""
+
+        assert mock_stream.call_count == 1
+
+    @patch("services.web_research_service._MAX_PAGE_BYTES", 64)
+    @patch("services.web_research_service.httpx.Client.stream")
+    @patch.object(WebResearchService, "_is_allowed", return_value=True)
+    def test_stops_reading_oversized_pages(self, _mock_allowed, mock_stream):
+        chunks = [b"<html><body><p>First chunk of text</p>"] + [b"<p>more filler text</p>"] * 50
+        consumed = []
+
+        def _iter_bytes():
+            for chunk in chunks:
+                consumed.append(chunk)
+                yield chunk
+
+        response = _page_stream("")
+        response.iter_bytes.side_effect = _iter_bytes
+        mock_stream.return_value = response
+
+        service = WebResearchService(timeout=5, delay=0)
+        result = service._fetch_and_parse("https://example.com")
+
+        assert result.startswith("First chunk of text")
+        assert len(consumed) < len(chunks)
+
     @patch.object(WebResearchService, "_scrape_website", return_value="")
     def test_research_lead_returns_result_on_failure(self, _mock_scrape):
         service = WebResearchService(timeout=5, delay=0)
@@ -183,41 +327,163 @@ class TestGracefulFailure:
 class TestCache:
     """Test in-memory caching."""
 
-    @patch("services.web_research_service.httpx.get")
+    @patch("services.web_research_service.httpx.Client.stream")
     @patch.object(WebResearchService, "_is_allowed", return_value=True)
-    def test_cache_hit_skips_http(self, _mock_allowed, mock_get):
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.text = "<html><body><p>Cached content here</p></body></html>"
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
+    def test_cache_hit_skips_http(self, _mock_allowed, mock_stream):
+        mock_stream.return_value = _page_stream("<html><body><p>Cached content here</p></body></html>")
 
         service = WebResearchService(timeout=5, delay=0)
 
         # First call — makes HTTP request
         result1 = service._fetch_and_parse("https://example.com")
         assert "Cached content" in result1
-        assert mock_get.call_count == 1
+        assert mock_stream.call_count == 1
 
         # Second call — should use cache, no new HTTP request
         result2 = service._fetch_and_parse("https://example.com")
         assert result2 == result1
-        assert mock_get.call_count == 1  # Still 1, no new request
+        assert mock_stream.call_count == 1  # Still 1, no new request
 
-    @patch("services.web_research_service.httpx.get")
+    @patch("services.web_research_service.httpx.Client.stream")
     @patch.object(WebResearchService, "_is_allowed", return_value=True)
-    def test_different_urls_not_cached(self, _mock_allowed, mock_get):
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.text = "<html><body><p>Some content</p></body></html>"
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
+    def test_equivalent_urls_hit_cache(self, _mock_allowed, mock_stream):
+        mock_stream.return_value = _page_stream("<html><body><p>About us content</p></body></html>")
+
+        service = WebResearchService(timeout=5, delay=0)
+
+        service._fetch_and_parse("https://example.com/about")
+        result = service._fetch_and_parse("https://example.com/about/?utm_source=x#team")
+        assert "About us content" in result
+        assert mock_stream.call_count == 1
+
+    @patch("services.web_research_service.httpx.Client.stream")
+    @patch.object(WebResearchService, "_is_allowed", return_value=True)
+    def test_different_urls_not_cached(self, _mock_allowed, mock_stream):
+        mock_stream.return_value = _page_stream("<html><body><p>Some content</p></body></html>")
 
         service = WebResearchService(timeout=5, delay=0)
 
         service._fetch_and_parse("https://example.com")
         service._fetch_and_parse("https://other.com")
-        assert mock_get.call_count == 2
+        assert mock_stream.call_count == 2
+
+
+class TestLRU2Cache:
+    """Test the bounded page cache."""
+
+    def test_evicts_least_recently_used_past_maxsize(self):
+        cache = _LRU2Cache(maxsize=2, ttl=60)
+        cache["a"] = "A"
+        cache["b"] = "B"
+        assert cache.get("a") == "A"  # "a" is now most recently used
+        cache["c"] = "C"
+
+        assert "b" not in cache
+        assert cache.get("a") == "A"
+        assert cache.get("c") == "C"
+        assert len(cache) == 2
+
+    def test_hot_entry_survives_scan_of_one_off_urls(self):
+        cache = _LRU2Cache(maxsize=50, ttl=60)
+        cache["https://hot.example"] = "hot"
+        cache.get("https://hot.example")
+        cache.get("https://hot.example")
+
+        for i in range(100):
+            cache[f"https://lead{i}.example"] = "once"
+
+        assert cache.get("https://hot.example") == "hot"
+        assert "https://lead0.example" not in cache
+        assert "https://lead99.example" in cache
+        assert len(cache) == 50
+
+    def test_hits_refresh_recency_instead_of_evicting_in_insertion_order(self):
+        cache = _LRU2Cache(maxsize=3, ttl=60)
+        for key in ("a", "b", "c"):
+            cache[key] = key.upper()
+        for key in ("a", "b", "c"):
+            cache.get(key)
+        cache.get("a")  # "a" was inserted first but is now the most recently used
+        cache["d"] = "D"
+
+        # FIFO would drop "a"; LRU-2 drops "b", whose earlier access is oldest
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+
+    @patch("services.web_research_service._PAGE_CACHE_MAX_ENTRIES", 3)
+    @patch("services.web_research_service.httpx.Client.stream")
+    @patch.object(WebResearchService, "_is_allowed", return_value=True)
+    def test_service_cache_hit_protects_page_from_eviction(self, _mock_allowed, mock_stream):
+        mock_stream.return_value = _page_stream("<html><body><p>Some content</p></body></html>")
+        service = WebResearchService(timeout=5, delay=0)
+
+        service._fetch_and_parse("https://hot.example")
+        service._fetch_and_parse("https://hot.example")  # cache hit
+        for i in range(5):
+            service._fetch_and_parse(f"https://lead{i}.example")
+        service._fetch_and_parse("https://hot.example")
+
+        assert mock_stream.call_count == 6
+
+    def test_expired_entries_are_misses(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(web_research_service.time, "monotonic", lambda: now[0])
+        cache = _LRU2Cache(maxsize=2, ttl=10)
+        cache["a"] = ""
+
+        assert cache.get("a") == ""
+        now[0] += 11
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_expired_entries_are_evicted_before_live_ones(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(web_research_service.time, "monotonic", lambda: now[0])
+        cache = _LRU2Cache(maxsize=3, ttl=10)
+        for key in ("a", "b", "c"):
+            cache[key] = key.upper()
+        for _ in range(2):
+            for key in ("a", "b", "c"):
+                cache.get(key)
+        now[0] += 11
+
+        for key in ("d", "e", "f"):
+            cache[key] = key.upper()
+
+        # Stale hot entries must not outrank fresh one-off entries
+        assert [cache.get(key) for key in ("d", "e", "f")] == ["D", "E", "F"]
+        assert len(cache) == 3
+
+    @patch("services.web_research_service.httpx.Client.stream")
+    @patch.object(WebResearchService, "_is_allowed", return_value=True)
+    def test_service_cache_is_bounded(self, _mock_allowed, mock_stream):
+        mock_stream.return_value = _page_stream("<html><body><p>Some content</p></body></html>")
+        service = WebResearchService(timeout=5, delay=0)
+        limit = web_research_service._PAGE_CACHE_MAX_ENTRIES
+
+        for i in range(limit + 1):
+            service._fetch_and_parse(f"https://example{i}.com")
+        assert len(service._cache) == limit
+
+        service._fetch_and_parse("https://example0.com")
+        assert mock_stream.call_count == limit + 2
+
+
+class TestLeadRequests:
+    """Test per-lead request accounting."""
+
+    def test_spaces_out_start_times(self, monkeypatch):
+        now = [100.0]
+        monkeypatch.setattr("services.web_research_service.time.monotonic", lambda: now[0])
+        lead = _LeadRequests()
+
+        assert lead.reserve(1.0) == 0
+        assert lead.reserve(1.0) == 1.0
+        assert lead.reserve(1.0) == 2.0
+        now[0] += 5
+        assert lead.reserve(1.0) == 0
+        assert lead.count == 4
 
 
 # --- Content Truncation ---
@@ -284,14 +550,10 @@ class TestWebResearchResult:
 class TestResearchLead:
     """Test the research_lead method end-to-end with mocks."""
 
-    @patch("services.web_research_service.httpx.get")
+    @patch("services.web_research_service.httpx.Client.stream")
     @patch.object(WebResearchService, "_is_allowed", return_value=True)
-    def test_scrapes_homepage_and_subpages(self, _mock_allowed, mock_get):
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.text = "<html><body><p>Great company content</p></body></html>"
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
+    def test_scrapes_homepage_and_subpages(self, _mock_allowed, mock_stream):
+        mock_stream.return_value = _page_stream("<html><body><p>Great company content</p></body></html>")
 
         service = WebResearchService(timeout=5, delay=0, max_pages=2)
         result = service.research_lead({
@@ -303,6 +565,79 @@ class TestResearchLead:
         assert "Great company content" in result.website_content
         assert result.pages_fetched >= 1
 
+    @patch.object(WebResearchService, "_fetch_and_parse", return_value="x" * 2000)
+    def test_skips_subpages_once_homepage_meets_target(self, mock_fetch):
+        service = WebResearchService(
+            timeout=5, delay=0, max_pages=3, target_chars=1000, run_all_providers=False
+        )
+        content = service._scrape_website("https://example.com")
+
+        mock_fetch.assert_called_once_with("https://example.com")
+        assert content.startswith("[Homepage]")
+
+    def test_stops_using_wave_pages_once_target_is_met(self):
+        pages = {"https://example.com": "h" * 400, "https://example.com/about": "a" * 700}
+
+        service = WebResearchService(
+            timeout=5, delay=0, max_pages=3, target_chars=1000, run_all_providers=False
+        )
+        with patch.object(
+            service, "_fetch_and_parse", side_effect=lambda url: pages.get(url, "p" * 700)
+        ):
+            content = service._scrape_website("https://example.com")
+
+        assert "[/about]" in content
+        assert "[/pricing]" not in content
+
+    @patch.object(WebResearchService, "_fetch_and_parse", return_value="x" * 2000)
+    def test_run_all_still_scrapes_subpages(self, mock_fetch):
+        service = WebResearchService(
+            timeout=5, delay=0, max_pages=3, target_chars=1000, run_all_providers=True
+        )
+        service._scrape_website("https://example.com")
+
+        assert mock_fetch.call_count == 3
+
+    def test_subpages_are_fetched_concurrently(self):
+        # Each subpage fetch waits until the other has started; a serial
+        # fetch would break the barrier instead of passing it.
+        both_started = threading.Barrier(2, timeout=5)
+        overlapped = []
+
+        def _fetch(url):
+            if url != "https://example.com":
+                try:
+                    both_started.wait()
+                    overlapped.append(url)
+                except threading.BrokenBarrierError:
+                    pass
+            return f"content from {url}"
+
+        service = WebResearchService(
+            timeout=5, delay=0, max_pages=3, target_chars=1, run_all_providers=True
+        )
+        with patch.object(service, "_fetch_and_parse", side_effect=_fetch):
+            content = service._scrape_website("https://example.com")
+
+        assert len(overlapped) == 2
+        assert content.index("[/about]") < content.index("[/pricing]")
+
+    def test_empty_subpage_is_replaced_by_next_candidate(self):
+        pages = {"https://example.com/about": ""}
+
+        service = WebResearchService(
+            timeout=5, delay=0, max_pages=3, target_chars=1, run_all_providers=True
+        )
+        with patch.object(
+            service, "_fetch_and_parse", side_effect=lambda url: pages.get(url, "text")
+        ) as mock_fetch:
+            content = service._scrape_website("https://example.com")
+
+        assert mock_fetch.call_count == 4
+        assert "[/pricing]" in content
+        assert "[/blog]" in content
+        assert "[/about]" not in content
+
     def test_no_website_still_works(self):
         service = WebResearchService(timeout=5, delay=0)
         result = service.research_lead({
@@ -318,7 +653,7 @@ class TestResearchLead:
 class TestBraveSearch:
     """Test Brave API response parsing."""
 
-    @patch("services.web_research_service.httpx.get")
+    @patch("services.web_research_service.httpx.Client.get")
     def test_brave_search_returns_text_and_urls(self, mock_get):
         mock_response = MagicMock()
         mock_response.raise_for_status.return_value = None
@@ -339,6 +674,30 @@ class TestBraveSearch:
         assert "T2" in text
         assert urls == ["https://a.example", "https://b.example"]
 
+    @patch("services.web_research_service.httpx.Client.get")
+    def test_brave_search_formats_one_line_per_result(self, mock_get):
+        mock_response = MagicMock()
+        mock_response.raise_for_status.return_value = None
+        results = [
+            {"title": f"T{i}", "description": f"D{i}", "url": f" https://{i}.example "}
+            for i in range(6)
+        ]
+        results[2]["url"] = "  "
+        mock_response.json.return_value = {"web": {"results": results}}
+        mock_get.return_value = mock_response
+
+        service = WebResearchService(timeout=5, delay=0, brave_api_key="test-key")
+        text, urls = service._brave_search("acme")
+
+        assert text.splitlines() == [
+            "- T0: D0 ( https://0.example )",
+            "- T1: D1 ( https://1.example )",
+            "- T2: D2 (  )",
+            "- T3: D3 ( https://3.example )",
+            "- T4: D4 ( https://4.example )",
+        ]
+        assert urls == ["https://0.example", "https://1.example", "https://3.example", "https://4.example"]
+
 
 class TestWaterfallBehavior:
     """Test provider waterfall stop/continue logic."""
@@ -385,6 +744,48 @@ class TestWaterfallBehavior:
         mock_brave.assert_called_once_with("Acme")
         assert "Brave details" in result.search_results
 
+    @patch.object(WebResearchService, "_scrape_website", return_value="Site text")
+    @patch.object(
+        WebResearchService,
+        "_brave_search",
+        return_value=("Brave details", ["https://example.com", "https://b.example"]),
+    )
+    def test_source_urls_are_deduplicated_in_order(self, _mock_brave, _mock_scrape):
+        service = WebResearchService(
+            timeout=5,
+            delay=0,
+            brave_api_key="test-key",
+            provider_order=["website", "brave"],
+            run_all_providers=True,
+        )
+        result = service.research_lead(
+            {"company_name": "Acme", "website": "https://example.com"}
+        )
+
+        assert result.source_urls == ["https://example.com", "https://b.example"]
+
+    @patch.object(WebResearchService, "_scrape_website", return_value="Site text")
+    @patch.object(WebResearchService, "_brave_search", return_value=("Brave details", []))
+    def test_reassigned_provider_order_is_used(self, _mock_brave, _mock_scrape):
+        service = WebResearchService(
+            timeout=5,
+            delay=0,
+            brave_api_key="test-key",
+            provider_order=["website", "brave"],
+            run_all_providers=True,
+        )
+        service.provider_order = ["brave"]
+        result = service.research_lead(
+            {"company_name": "Acme", "website": "https://example.com"}
+        )
+
+        assert [item["provider"] for item in result.provider_trace] == ["brave"]
+
     def test_parse_provider_order_filters_unknown_and_duplicates(self):
         order = WebResearchService._parse_provider_order("website,unknown,brave,website")
         assert order == ["website", "brave"]
+
+    def test_parse_provider_order_matches_whole_items_only(self):
+        assert WebResearchService._parse_provider_order(" Brave , WEBSITE") == ["brave", "website"]
+        assert WebResearchService._parse_provider_order("my website,brave") == ["brave"]
+        assert WebResearchService._parse_provider_order("brave-search") == ["website", "brave"]